@@ -1,7 +1,17 @@
-# API endpoints
-BASE_URL = "http://api.openweathermap.org/data/2.5/weather?"
-FORECAST_URL = "http://api.openweathermap.org/data/2.5/forecast?"
-GEOCODING_URL = "http://ip-api.com/json/"
+import os
+
+# API endpoints. WEATHER_API_BASE / IP_API_BASE point every OpenWeatherMap or
+# ip-api request at another server, e.g. tools/stub_server.py for benchmarks.
+_API_BASE = os.environ.get("WEATHER_API_BASE", "").rstrip("/")
+_OWM_BASE = _API_BASE or "http://api.openweathermap.org"
+_OWM_SECURE_BASE = _API_BASE or "https://api.openweathermap.org"
+_IP_API_BASE = os.environ.get("IP_API_BASE", "http://ip-api.com").rstrip("/")
+
+BASE_URL = f"{_OWM_BASE}/data/2.5/weather?"
+FORECAST_URL = f"{_OWM_BASE}/data/2.5/forecast?"
+ONECALL_URL = f"{_OWM_SECURE_BASE}/data/2.5/onecall"
+DIRECT_GEOCODING_URL = f"{_OWM_BASE}/geo/1.0/direct"
+GEOCODING_URL = f"{_IP_API_BASE}/json/"
 
 # Temperature colors
 TEMP_COLORS = {
@@ -15,3 +25,45 @@ TEMP_COLORS = {
 # Default window settings
 DEFAULT_WINDOW_SIZE = "800x600"
 MIN_WINDOW_SIZE = (600, 400)
+
+# Response cache settings (seconds)
+CACHE_TTLS = {
+    "current": 10 * 60,
+    "forecast": 60 * 60,
+    "uv": 30 * 60,
+    "onecall": 10 * 60,
+    "geo": 30 * 24 * 60 * 60,
+}
+CACHE_MAX_ENTRIES = 128
+
+# On-disk response cache
+DISK_CACHE_PATH = "weather_cache.db"
+DISK_CACHE_MAX_BYTES = 5 * 1024 * 1024
+DISK_CACHE_MAX_AGE = 7 * 24 * 60 * 60  # drop entries untouched for a week
+
+# HTTP transport
+HTTP_TIMEOUT = (3.05, 10)  # (connect, read) seconds
+HTTP_RETRIES = 2
+HTTP_BACKOFF = 0.5  # base delay in seconds, doubled per retry
+HTTP_MAX_BACKOFF = 8
+HTTP_POOL_SIZE = 16
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 30  # seconds before a tripped host is probed again
+
+# API quotas per host (free tiers); hosts not listed are not limited
+PREFERENCES_DB_PATH = "weather_preferences.db"
+API_QUOTAS = {
+    "api.openweathermap.org": {
+        "per_minute": 60,
+        "daily": 30000,
+        "monthly": 1000000,
+    },
+    "ip-api.com": {"per_minute": 45},
+}
+QUOTA_MAX_WAIT = 5  # seconds a foreground call may wait for a token
+QUOTA_PRESSURE = 0.8  # share of a budget after which background calls are refused
+
+# Record/replay of API traffic (see services/cassette.py)
+CASSETTE_PATH = os.environ.get("WEATHER_CASSETTE", "")
+CASSETTE_MODE = os.environ.get("WEATHER_CASSETTE_MODE", "record")  # or replay
+REPLAY_SPEED = float(os.environ.get("WEATHER_REPLAY_SPEED", "1.0"))
@@ -0,0 +1,128 @@
+"""OpenWeatherMap condition codes
+
+Conditions are keyed by the numeric `weather[0].id` of a response, which
+is stable across languages, unlike the description text. See
+https://openweathermap.org/weather-conditions for the full list.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from utils.logger import logger
+
+
+@dataclass(frozen=True, slots=True)
+class Condition:
+    """Display attributes of one OWM condition id"""
+
+    id: int
+    group: str
+    description: str
+    emoji: str
+    animation: str  # "thunder", "rain", "snow" or "clear"
+    severity: int  # 0 (calm) to 4 (extreme)
+
+
+# Group (id // 100, or 8 for clear/clouds) -> (name, emoji, animation)
+GROUPS = {
+    2: ("Thunderstorm", "⛈️", "thunder"),
+    3: ("Drizzle", "🌧️", "rain"),
+    5: ("Rain", "🌧️", "rain"),
+    6: ("Snow", "🌨️", "snow"),
+    7: ("Atmosphere", "🌫️", "clear"),
+    8: ("Clouds", "☁️", "clear"),
+}
+
+# id -> (description, severity, emoji override)
+CONDITION_CODES = {
+    200: ("thunderstorm with light rain", 2, None),
+    201: ("thunderstorm with rain", 3, None),
+    202: ("thunderstorm with heavy rain", 4, None),
+    210: ("light thunderstorm", 2, None),
+    211: ("thunderstorm", 3, None),
+    212: ("heavy thunderstorm", 4, None),
+    221: ("ragged thunderstorm", 3, None),
+    230: ("thunderstorm with light drizzle", 2, None),
+    231: ("thunderstorm with drizzle", 2, None),
+    232: ("thunderstorm with heavy drizzle", 3, None),
+    300: ("light intensity drizzle", 1, None),
+    301: ("drizzle", 1, None),
+    302: ("heavy intensity drizzle", 2, None),
+    310: ("light intensity drizzle rain", 1, None),
+    311: ("drizzle rain", 1, None),
+    312: ("heavy intensity drizzle rain", 2, None),
+    313: ("shower rain and drizzle", 2, None),
+    314: ("heavy shower rain and drizzle", 2, None),
+    321: ("shower drizzle", 1, None),
+    500: ("light rain", 1, "🌦️"),
+    501: ("moderate rain", 2, None),
+    502: ("heavy intensity rain", 3, None),
+    503: ("very heavy rain", 3, None),
+    504: ("extreme rain", 4, None),
+    511: ("freezing rain", 3, None),
+    520: ("light intensity shower rain", 1, None),
+    521: ("shower rain", 2, None),
+    522: ("heavy intensity shower rain", 3, None),
+    531: ("ragged shower rain", 2, None),
+    600: ("light snow", 1, None),
+    601: ("snow", 2, None),
+    602: ("heavy snow", 3, None),
+    611: ("sleet", 2, None),
+    612: ("light shower sleet", 1, None),
+    613: ("shower sleet", 2, None),
+    615: ("light rain and snow", 1, None),
+    616: ("rain and snow", 2, None),
+    620: ("light shower snow", 1, None),
+    621: ("shower snow", 2, None),
+    622: ("heavy shower snow", 3, None),
+    701: ("mist", 1, None),
+    711: ("smoke", 1, None),
+    721: ("haze", 1, None),
+    731: ("sand/dust whirls", 2, None),
+    741: ("fog", 1, None),
+    751: ("sand", 2, None),
+    761: ("dust", 2, None),
+    762: ("volcanic ash", 3, None),
+    771: ("squalls", 3, "💨"),
+    781: ("tornado", 4, "🌪️"),
+    800: ("clear sky", 0, "☀️"),
+    801: ("few clouds", 0, "🌤️"),
+    802: ("scattered clouds", 0, "⛅"),
+    803: ("broken clouds", 0, None),
+    804: ("overcast clouds", 0, None),
+}
+
+
+def _build_condition(condition_id, description, severity, emoji):
+    group, group_emoji, animation = GROUPS[condition_id // 100]
+    if condition_id == 800:
+        group = "Clear"
+    return Condition(
+        condition_id, group, description, emoji or group_emoji, animation, severity
+    )
+
+
+CONDITIONS = {
+    condition_id: _build_condition(condition_id, *row)
+    for condition_id, row in CONDITION_CODES.items()
+}
+
+
+@lru_cache(maxsize=None)
+def get_condition(condition_id):
+    """Condition for an OWM id; unknown ids are logged once and fall back
+
+    An id missing from the table still gets its group's emoji and
+    animation when the group is known.
+    """
+    condition = CONDITIONS.get(condition_id)
+    if condition is not None:
+        return condition
+    logger.warning(f"Unknown weather condition id: {condition_id}")
+    if condition_id // 100 in GROUPS:
+        return _build_condition(condition_id, "unknown", 1, None)
+    return Condition(condition_id, "Unknown", "unknown", "❓", "clear", 0)
+
+
+def condition_emoji(condition_id):
+    """Display emoji for an OWM condition id"""
+    return get_condition(condition_id).emoji
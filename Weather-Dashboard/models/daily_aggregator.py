@@ -0,0 +1,139 @@
+from datetime import date, timedelta
+from models.weather import DailySummary
+
+SECONDS_PER_DAY = 86400
+EPOCH = date(1970, 1, 1)
+
+
+class DayStats:
+    """Running totals for one day of forecast points"""
+
+    __slots__ = (
+        "count",
+        "total",
+        "low",
+        "high",
+        "precipitation",
+        "pop",
+        "wind_max",
+        "conditions",
+        "descriptions",
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.low = float("inf")
+        self.high = float("-inf")
+        self.precipitation = 0.0
+        self.pop = 0.0
+        self.wind_max = 0.0
+        self.conditions = {}  # condition id -> number of points
+        self.descriptions = {}  # condition id -> first description seen
+
+    def add(
+        self,
+        temp,
+        temp_min,
+        temp_max,
+        wind_speed,
+        precipitation,
+        pop,
+        condition_id,
+        description,
+    ):
+        self.count += 1
+        self.total += temp
+        if temp_min < self.low:
+            self.low = temp_min
+        if temp_max > self.high:
+            self.high = temp_max
+        self.precipitation += precipitation
+        if pop > self.pop:
+            self.pop = pop
+        if wind_speed > self.wind_max:
+            self.wind_max = wind_speed
+        self.conditions[condition_id] = self.conditions.get(condition_id, 0) + 1
+        self.descriptions.setdefault(condition_id, description)
+
+    def summary(self, day):
+        # max() keeps the first of equally frequent conditions, i.e. the earliest
+        condition_id = max(self.conditions, key=self.conditions.__getitem__)
+        return DailySummary(
+            date=day,
+            temp_min=self.low,
+            temp_max=self.high,
+            temp_mean=self.total / self.count,
+            condition_id=condition_id,
+            description=self.descriptions[condition_id],
+            precipitation=self.precipitation,
+            pop=self.pop,
+            wind_max=self.wind_max,
+        )
+
+
+class DailyAggregator:
+    """Incremental per-day rollup of a forecast, in the city's local days
+
+    Points are folded in as they arrive, so extending a forecast only
+    touches the days the new points fall on.
+    """
+
+    def __init__(self, utc_offset=0):
+        self.utc_offset = int(utc_offset)
+        self.days = {}  # days since epoch (city-local) -> DayStats
+        self.last_dt = None
+
+    def add(
+        self,
+        dt,
+        temp,
+        temp_min,
+        temp_max,
+        wind_speed,
+        precipitation,
+        pop,
+        condition_id,
+        description,
+    ):
+        """Fold one forecast point into its day
+
+        temp_min and temp_max bound the point's own range, which for a
+        daily OneCall point is the whole day.
+        """
+        day = (dt + self.utc_offset) // SECONDS_PER_DAY
+        stats = self.days.get(day)
+        if stats is None:
+            stats = self.days[day] = DayStats()
+        stats.add(
+            temp,
+            temp_min,
+            temp_max,
+            wind_speed,
+            precipitation,
+            pop,
+            condition_id,
+            description,
+        )
+        if self.last_dt is None or dt > self.last_dt:
+            self.last_dt = dt
+
+    def add_series(self, series, start=0):
+        """Fold in the points of a ForecastSeries from index `start` on"""
+        for point in zip(
+            series.timestamps[start:],
+            series.temp[start:],
+            series.temp_min[start:],
+            series.temp_max[start:],
+            series.wind_speed[start:],
+            series.precipitation[start:],
+            series.pop[start:],
+            series.condition_id[start:],
+            series.descriptions[start:],
+        ):
+            self.add(*point)
+
+    def summaries(self, limit=None):
+        """DailySummary rows in date order, at most `limit` of them"""
+        days = sorted(self.days)[:limit]
+        return [self.days[day].summary(EPOCH + timedelta(days=day)) for day in days]
@@ -0,0 +1,193 @@
+from array import array
+from datetime import datetime
+from models.daily_aggregator import DailyAggregator
+from models.weather import ForecastPoint, precipitation_of
+from utils.time_format import get_formatter
+from utils.units import convert_temperatures, scale_column
+
+COLUMNS = (
+    "timestamps",
+    "temp",
+    "temp_min",
+    "temp_max",
+    "humidity",
+    "wind_speed",
+    "pressure",
+    "condition_id",
+    "descriptions",
+    "precipitation",
+    "pop",
+)
+
+
+def local_utc_offset():
+    """This machine's current UTC offset in seconds"""
+    return int(datetime.now().astimezone().utcoffset().total_seconds())
+
+
+class ForecastSeries:
+    """Column-oriented forecast: one contiguous array per field.
+
+    A freshly decoded series holds API units (Kelvin, m/s) and `units` is
+    None; `converted` returns a copy in a UnitSystem's display units so
+    renderers never convert per value. Whole-column conversions use NumPy
+    when installed; the arrays themselves are plain `array.array` so the
+    type works without it.
+    """
+
+    __slots__ = COLUMNS + ("units", "utc_offset", "_daily")
+
+    def __init__(
+        self,
+        timestamps=(),
+        temp=(),
+        humidity=(),
+        wind_speed=(),
+        pressure=(),
+        condition_id=(),
+        descriptions=(),
+        precipitation=None,
+        pop=None,
+        utc_offset=None,
+        temp_min=None,
+        temp_max=None,
+    ):
+        self.timestamps = array("q", timestamps)
+        self.temp = array("d", temp)
+        # Range the point stands for; a daily OneCall point spans the day
+        self.temp_min = array("d", self.temp if temp_min is None else temp_min)
+        self.temp_max = array("d", self.temp if temp_max is None else temp_max)
+        self.humidity = array("d", humidity)
+        self.wind_speed = array("d", wind_speed)
+        self.pressure = array("d", pressure)
+        self.condition_id = array("H", condition_id)
+        self.descriptions = list(descriptions)
+        self.precipitation = array("d", precipitation or [0.0] * len(self.timestamps))
+        self.pop = array("d", pop or [0.0] * len(self.timestamps))
+        self.units = None
+        # City's UTC offset in seconds; None falls back to the machine's
+        self.utc_offset = utc_offset
+        self._daily = None
+
+    @classmethod
+    def from_payload(cls, payload):
+        """Decode a /forecast response straight into columns"""
+        series = cls(utc_offset=payload.get("city", {}).get("timezone"))
+        series.extend(payload["list"])
+        return series
+
+    def extend(self, items):
+        """Append /forecast list items newer than the last point
+
+        Items must be in API units; the daily rollup, if already built, is
+        updated with just the new points.
+        """
+        if self.units is not None:
+            raise ValueError("Cannot extend a converted ForecastSeries")
+        start = len(self)
+        last_dt = self.timestamps[-1] if start else None
+        for item in items:
+            if last_dt is not None and item["dt"] <= last_dt:
+                continue
+            main = item["main"]
+            weather = item["weather"][0]
+            self.timestamps.append(item["dt"])
+            self.temp.append(main["temp"])
+            self.temp_min.append(main.get("temp_min", main["temp"]))
+            self.temp_max.append(main.get("temp_max", main["temp"]))
+            self.humidity.append(main.get("humidity", 0))
+            self.wind_speed.append(item.get("wind", {}).get("speed", 0.0))
+            self.pressure.append(main.get("pressure", 0))
+            self.condition_id.append(weather.get("id", 0))
+            self.descriptions.append(weather["description"])
+            self.precipitation.append(precipitation_of(item))
+            self.pop.append(item.get("pop", 0.0))
+        if self._daily is not None:
+            self._daily.add_series(self, start)
+
+    def __len__(self):
+        return len(self.timestamps)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            series = ForecastSeries(utc_offset=self.utc_offset)
+            for name in COLUMNS:
+                setattr(series, name, getattr(self, name)[index])
+            series.units = self.units
+            return series
+        return ForecastPoint(
+            dt=self.timestamps[index],
+            temp=self.temp[index],
+            humidity=int(self.humidity[index]),
+            pressure=int(self.pressure[index]),
+            wind_speed=self.wind_speed[index],
+            condition_id=self.condition_id[index],
+            description=self.descriptions[index],
+            precipitation=self.precipitation[index],
+            pop=self.pop[index],
+        )
+
+    @property
+    def temp_unit(self):
+        return self.units.temp_unit if self.units else "K"
+
+    def converted(self, units):
+        """Copy of this series in the display units of a UnitSystem"""
+        if self.units is units:
+            return self
+        series = self[:]
+        for name in ("temp", "temp_min", "temp_max"):
+            setattr(
+                series,
+                name,
+                convert_temperatures(
+                    getattr(self, name), units.temp_unit, self.temp_unit
+                ),
+            )
+        speed_scale = units.speed_scale / (self.units.speed_scale if self.units else 1)
+        series.wind_speed = scale_column(self.wind_speed, speed_scale)
+        series.units = units
+        return series
+
+    def temperatures(self, unit=None):
+        """Temperature column, converted to 'C', 'F' or 'K' if asked"""
+        if unit is None or unit == self.temp_unit:
+            return self.temp
+        return convert_temperatures(self.temp, unit, self.temp_unit)
+
+    def datetimes(self):
+        """Timestamps as aware datetimes in the city's UTC offset"""
+        return get_formatter(self.utc_offset).datetimes(self.timestamps)
+
+    def labels(self, fmt="%H:%M"):
+        """Timestamps formatted in the city's UTC offset, in one batch"""
+        return get_formatter(self.utc_offset).format_many(self.timestamps, fmt)
+
+    def time_fractions(self):
+        """Each point's position between the first and last timestamp, 0..1
+
+        Points are not evenly spaced when a OneCall forecast switches from
+        3-hourly to daily entries, so charts place them by time. Falls back
+        to even spacing when all points share one timestamp.
+        """
+        timestamps = self.timestamps
+        count = len(timestamps)
+        span = timestamps[-1] - timestamps[0] if count else 0
+        if span <= 0:
+            return [i / max(count - 1, 1) for i in range(count)]
+        start = timestamps[0]
+        return [(t - start) / span for t in timestamps]
+
+    def daily(self, limit=7):
+        """DailySummary rows per city-local day, in the series' units
+
+        The rollup is built in one pass on first use and kept up to date
+        by `extend`.
+        """
+        if self._daily is None:
+            offset = self.utc_offset
+            self._daily = DailyAggregator(
+                local_utc_offset() if offset is None else offset
+            )
+            self._daily.add_series(self)
+        return self._daily.summaries(limit)
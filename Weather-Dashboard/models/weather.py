@@ -0,0 +1,109 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentConditions:
+    """Current weather for one location
+
+    Decoded in the API's units (Kelvin, m/s); UnitSystem.convert_current
+    returns the copy in display units that the GUI uses.
+    """
+
+    name: str
+    country: str
+    lat: float
+    lon: float
+    dt: int
+    timezone: int  # UTC offset in seconds
+    condition_id: int
+    description: str
+    temp: float
+    feels_like: float
+    temp_min: float
+    temp_max: float
+    humidity: int
+    pressure: int
+    wind_speed: float
+    wind_deg: int
+    wind_gust: Optional[float]
+    visibility: int
+    sunrise: Optional[int]
+    sunset: Optional[int]
+
+
+@dataclass(frozen=True, slots=True)
+class ForecastPoint:
+    """One forecast sample, in the units of the series it came from"""
+
+    dt: int
+    temp: float
+    humidity: int
+    pressure: int
+    wind_speed: float
+    condition_id: int
+    description: str
+    precipitation: float = 0.0  # rain + snow in mm
+    pop: float = 0.0  # probability of precipitation, 0-1
+
+
+@dataclass(frozen=True, slots=True)
+class DailySummary:
+    """Forecast rollup for one city-local calendar day"""
+
+    date: object  # datetime.date
+    temp_min: float
+    temp_max: float
+    temp_mean: float
+    condition_id: int  # most frequent condition of the day
+    description: str
+    precipitation: float
+    pop: float
+    wind_max: float
+
+
+def precipitation_of(item):
+    """Rain plus snow in mm for a forecast item
+
+    /forecast and the thinned OneCall hourly points report {"3h": mm}, raw
+    OneCall hourly {"1h": mm} and OneCall daily a bare number.
+    """
+    total = 0.0
+    for key in ("rain", "snow"):
+        amount = item.get(key)
+        if isinstance(amount, dict):
+            total += amount.get("3h", amount.get("1h", 0.0))
+        elif amount:
+            total += amount
+    return total
+
+
+def decode_current(payload):
+    """Decode a /weather response into CurrentConditions"""
+    main = payload["main"]
+    wind = payload.get("wind", {})
+    weather = payload["weather"][0]
+    sys = payload.get("sys", {})
+    coord = payload.get("coord", {})
+    return CurrentConditions(
+        name=payload.get("name", ""),
+        country=sys.get("country", ""),
+        lat=coord.get("lat", 0.0),
+        lon=coord.get("lon", 0.0),
+        dt=payload.get("dt", 0),
+        timezone=payload.get("timezone", 0),
+        condition_id=weather.get("id", 0),
+        description=weather["description"],
+        temp=main["temp"],
+        feels_like=main.get("feels_like", main["temp"]),
+        temp_min=main.get("temp_min", main["temp"]),
+        temp_max=main.get("temp_max", main["temp"]),
+        humidity=main.get("humidity", 0),
+        pressure=main.get("pressure", 0),
+        wind_speed=wind.get("speed", 0.0),
+        wind_deg=wind.get("deg", 0),
+        wind_gust=wind.get("gust"),
+        visibility=payload.get("visibility", 0),
+        sunrise=sys.get("sunrise"),
+        sunset=sys.get("sunset"),
+    )
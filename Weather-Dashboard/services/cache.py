@@ -0,0 +1,157 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from utils.logger import logger
+from services.quota import background_priority
+from config.constants import CACHE_TTLS, CACHE_MAX_ENTRIES
+
+
+def normalize_location(location):
+    """Normalize a location string so 'London, UK' and 'london,uk' share a key"""
+    parts = str(location).split(",")
+    return ",".join(" ".join(part.lower().split()) for part in parts)
+
+
+class CacheEntry:
+    __slots__ = ("value", "fetched_at", "ttl")
+
+    def __init__(self, value, fetched_at, ttl):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.ttl = ttl
+
+    def age(self, now):
+        return now - self.fetched_at
+
+
+class WeatherCache:
+    """In-memory TTL cache with per-endpoint expiry and LRU eviction.
+
+    A stale entry is returned immediately while a background refresh
+    replaces it (stale-while-revalidate). Entries older than twice their
+    TTL are treated as misses and fetched synchronously.
+    """
+
+    def __init__(self, ttls=None, max_entries=CACHE_MAX_ENTRIES):
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=2, thread_name_prefix="cache-refresh"
+        )
+
+    def get(self, endpoint, key, fetch, on_refresh=None):
+        """Return the cached value for (endpoint, key), calling fetch() on a miss
+
+        `on_refresh(value)` is called from a worker thread when a background
+        revalidation stores a newer value.
+        """
+        cache_key = (endpoint, key)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None:
+                self._entries.move_to_end(cache_key)
+
+        if entry is None or entry.age(now) >= entry.ttl * 2:
+            value = fetch()
+            self.put(endpoint, key, value)
+            return value
+
+        if entry.age(now) >= entry.ttl:
+            self._revalidate(cache_key, fetch, on_refresh)
+
+        return entry.value
+
+    def put(self, endpoint, key, value):
+        """Store a value, evicting the least recently used entries if needed"""
+        entry = CacheEntry(value, time.monotonic(), self.ttls.get(endpoint, 600))
+        with self._lock:
+            self._entries[(endpoint, key)] = entry
+            self._entries.move_to_end((endpoint, key))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint=None, key=None):
+        """Drop matching entries, or everything when called without arguments"""
+        with self._lock:
+            for cache_key in list(self._entries):
+                if endpoint in (None, cache_key[0]) and key in (None, cache_key[1]):
+                    del self._entries[cache_key]
+
+    def refreshing(self):
+        """True while any background revalidation is running
+
+        on_refresh() is called before the refresh is cleared, so a caller
+        that sees False here has already been handed every new value.
+        """
+        with self._lock:
+            return bool(self._refreshing)
+
+    def _revalidate(self, cache_key, fetch, on_refresh):
+        with self._lock:
+            if cache_key in self._refreshing:
+                return
+            self._refreshing.add(cache_key)
+        self._executor.submit(self._refresh, cache_key, fetch, on_refresh)
+
+    def _refresh(self, cache_key, fetch, on_refresh):
+        endpoint, key = cache_key
+        try:
+            logger.info(f"Revalidating stale {endpoint} data for {key}")
+            with background_priority():
+                value = fetch()
+            self.put(endpoint, key, value)
+            if on_refresh:
+                on_refresh(value)
+        except Exception as e:
+            # Keep serving the stale value; the next read will retry
+            logger.warning(f"Background refresh failed for {key}: {str(e)}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(cache_key)
+
+
+class CachedWeatherService:
+    """WeatherService wrapper that reads through a WeatherCache"""
+
+    def __init__(self, service, cache=None):
+        self.service = service
+        self.cache = cache or WeatherCache()
+
+    def get_current_weather(self, location, on_refresh=None):
+        """Fetch current weather data"""
+        return self.cache.get(
+            "current",
+            normalize_location(location),
+            lambda: self.service.get_current_weather(location),
+            on_refresh,
+        )
+
+    def get_forecast(self, location, on_refresh=None):
+        """Fetch forecast data"""
+        return self.cache.get(
+            "forecast",
+            normalize_location(location),
+            lambda: self.service.get_forecast(location),
+            on_refresh,
+        )
+
+    def get_uv_index(self, lat, lon, on_refresh=None):
+        """Fetch UV index for a coordinate pair"""
+        return self.cache.get(
+            "uv",
+            (round(lat, 2), round(lon, 2)),
+            lambda: self.service.get_uv_index(lat, lon),
+            on_refresh,
+        )
+
+    def fetch_many(self, locations, max_workers=8, fetch=None):
+        """Fetch several locations at once through the cache"""
+        return self.service.fetch_many(
+            locations, max_workers=max_workers, fetch=fetch or self.get_current_weather
+        )
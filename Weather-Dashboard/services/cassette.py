@@ -0,0 +1,187 @@
+import gzip
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from utils.logger import logger
+
+# Only headers the fetch layer looks at are kept
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Retry-After")
+# Query parameters never written to a cassette
+SECRET_PARAMS = {"appid"}
+
+
+class CassetteMiss(requests.exceptions.RequestException):
+    """Replay found no recorded response for a request
+
+    Not a ConnectionError, so ResilientSession neither retries it nor
+    counts it against the circuit breaker: a miss means the cassette does
+    not match the test, not that the network is down.
+    """
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def cassette_key(method, url):
+    """Match key for a request: method plus URL with sorted, redacted query"""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query) if k not in SECRET_PARAMS)
+    return f"{method} {urlunsplit(parts._replace(query=urlencode(query)))}"
+
+
+class RecordingAdapter(HTTPAdapter):
+    """HTTPAdapter that appends every exchange to a JSONL cassette.
+
+    Each line holds the request key, its offset from the start of the
+    recording, the time to response and the response itself. A path ending
+    in .gz is written gzip-compressed.
+    """
+
+    def __init__(self, path, **kwargs):
+        super().__init__(**kwargs)
+        self.path = path
+        self.started = time.monotonic()
+        self._lock = threading.Lock()
+        self._file = _open(path, "a")
+
+    def send(self, request, **kwargs):
+        sent_at = time.monotonic()
+        response = super().send(request, **kwargs)
+        record = {
+            "key": cassette_key(request.method, request.url),
+            "offset": round(sent_at - self.started, 4),
+            "elapsed": round(time.monotonic() - sent_at, 4),
+            "status": response.status_code,
+            "headers": {
+                name: response.headers[name]
+                for name in RECORDED_HEADERS
+                if name in response.headers
+            },
+            "body": response.text,
+        }
+        with self._lock:
+            self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            self._file.flush()
+        return response
+
+    def close(self):
+        super().close()
+        with self._lock:
+            self._file.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Transport adapter that answers requests from a recorded cassette.
+
+    Responses for the same request key are replayed in recording order (the
+    last one repeats once they run out) after the recorded response time
+    divided by `speed`; speed 0 replays without any delay.
+    """
+
+    def __init__(self, path, speed=1.0):
+        super().__init__()
+        self.speed = speed
+        self._records = defaultdict(deque)
+        self._last = {}
+        self._lock = threading.Lock()
+        with _open(path, "r") as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    self._records[record["key"]].append(record)
+        logger.info(
+            f"Loaded {sum(map(len, self._records.values()))} recorded responses"
+        )
+
+    def _next(self, key):
+        with self._lock:
+            queue = self._records.get(key)
+            if queue:
+                self._last[key] = queue.popleft()
+            return self._last.get(key)
+
+    def send(self, request, **kwargs):
+        key = cassette_key(request.method, request.url)
+        record = self._next(key)
+        if record is None:
+            raise CassetteMiss(f"No recorded response for {key}", request=request)
+
+        if self.speed:
+            time.sleep(record["elapsed"] / self.speed)
+
+        response = requests.Response()
+        response.status_code = record["status"]
+        response.headers = CaseInsensitiveDict(record["headers"])
+        response._content = record["body"].encode("utf-8")
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.reason = "Replayed"
+        return response
+
+    def close(self):
+        pass
+
+
+def install_cassette(session, path, mode="record", speed=1.0, pool_size=10):
+    """Mount a recording or replaying adapter on a requests.Session"""
+    if mode == "replay":
+        adapter = ReplayAdapter(path, speed=speed)
+    elif mode == "record":
+        adapter = RecordingAdapter(
+            path, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+    else:
+        raise ValueError(f"Unknown cassette mode: {mode}")
+
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    logger.info(f"API traffic {mode} mode using cassette {path}")
+    return adapter
+
+
+def recorded_requests(path):
+    """Yield (offset, method, url) for each exchange in a cassette"""
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                method, url = record["key"].split(" ", 1)
+                yield record["offset"], method, url
+
+
+def replay_workload(session, path, speed=1.0, max_workers=8):
+    """Re-issue a cassette's requests through `session` on their recorded schedule
+
+    Offsets are divided by `speed` (0 sends everything at once). Returns
+    (url, status, seconds) tuples, status None for failed requests, for
+    before/after comparisons of the fetch layer.
+    """
+
+    def issue(method, url):
+        started = time.perf_counter()
+        try:
+            status = session.request(method, url).status_code
+        except requests.exceptions.RequestException:
+            status = None
+        return url, status, time.perf_counter() - started
+
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for offset, method, url in recorded_requests(path):
+            if speed:
+                delay = start + offset / speed - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            futures.append(executor.submit(issue, method, url))
+        return [future.result() for future in futures]
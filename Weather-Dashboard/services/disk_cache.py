@@ -0,0 +1,299 @@
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from utils.logger import logger
+from config.constants import (
+    CACHE_TTLS,
+    CACHE_MAX_ENTRIES,
+    DISK_CACHE_PATH,
+    DISK_CACHE_MAX_BYTES,
+    DISK_CACHE_MAX_AGE,
+)
+
+# Returned by a read_through fetch when the server answered 304
+NOT_MODIFIED = object()
+
+
+def conditional_headers(validators):
+    """Build If-None-Match / If-Modified-Since headers from stored validators"""
+    headers = {}
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+    return headers
+
+
+def response_validators(response):
+    """Extract the ETag / Last-Modified validators from a response"""
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified"),
+    }
+
+
+class DiskCache:
+    """SQLite-backed cache of API responses that survives restarts.
+
+    Payloads are stored zlib-compressed and keyed by (endpoint, normalized
+    location), together with the ETag / Last-Modified validators the server
+    sent. Expired entries are kept so they can be revalidated with a
+    conditional request or served while the network is down; eviction
+    removes the least recently used rows once the cache grows beyond
+    `max_bytes`.
+
+    Decoded payloads are memoized per process, so a 304 hands back the very
+    same object and callers can skip redrawing by identity.
+    """
+
+    EVICT_EVERY = 50  # puts between eviction passes
+
+    def __init__(
+        self,
+        db_path=DISK_CACHE_PATH,
+        ttls=None,
+        max_bytes=DISK_CACHE_MAX_BYTES,
+        max_age=DISK_CACHE_MAX_AGE,
+        max_decoded=CACHE_MAX_ENTRIES,
+    ):
+        self.db_path = db_path
+        self.ttls = dict(CACHE_TTLS, **(ttls or {}))
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.max_decoded = max_decoded
+        self._decoded = OrderedDict()
+        self._puts = 0
+        self._lock = threading.Lock()
+        self.setup_database()
+        self.evict()
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def setup_database(self):
+        """Create the cache table if it doesn't exist"""
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    endpoint TEXT,
+                    location TEXT,
+                    payload BLOB,
+                    size INTEGER,
+                    fetched_at REAL,
+                    ttl REAL,
+                    last_access REAL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    PRIMARY KEY (endpoint, location)
+                )
+            """
+            )
+            # Caches created before validators were stored lack these columns
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+            conn.commit()
+
+    def _metadata(self, endpoint, location):
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT fetched_at, ttl, etag, last_modified FROM responses "
+                "WHERE endpoint = ? AND location = ?",
+                (endpoint, location),
+            ).fetchone()
+
+    def get(self, endpoint, location, allow_expired=False):
+        """Return the cached payload, or None if missing or expired"""
+        now = time.time()
+        row = self._metadata(endpoint, location)
+        if row is None:
+            return None
+
+        fetched_at, ttl, _, _ = row
+        if not allow_expired and now - fetched_at >= ttl:
+            return None
+
+        key = (endpoint, location)
+        with self._lock:
+            data = self._decoded.get(key)
+            if data is not None:
+                self._decoded.move_to_end(key)
+
+        with self._connect() as conn:
+            if data is None:
+                row = conn.execute(
+                    "SELECT payload FROM responses WHERE endpoint = ? AND location = ?",
+                    (endpoint, location),
+                ).fetchone()
+                if row is None:
+                    return None
+                payload = row[0]
+            conn.execute(
+                "UPDATE responses SET last_access = ? "
+                "WHERE endpoint = ? AND location = ?",
+                (now, endpoint, location),
+            )
+            conn.commit()
+
+        if data is None:
+            try:
+                data = json.loads(zlib.decompress(payload))
+            except (zlib.error, ValueError) as e:
+                logger.warning(
+                    f"Discarding corrupt cache entry {endpoint}/{location}: {e}"
+                )
+                self.delete(endpoint, location)
+                return None
+            self._remember(key, data)
+
+        return data
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._decoded[key] = data
+            self._decoded.move_to_end(key)
+            while len(self._decoded) > self.max_decoded:
+                self._decoded.popitem(last=False)
+
+    def put(self, endpoint, location, data, ttl=None, validators=None):
+        """Store a payload with its fetch time, TTL and validators"""
+        now = time.time()
+        validators = validators or {}
+        payload = zlib.compress(json.dumps(data, separators=(",", ":")).encode())
+        with self._connect() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO responses
+                   (endpoint, location, payload, size, fetched_at, ttl, last_access,
+                    etag, last_modified)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (
+                    endpoint,
+                    location,
+                    payload,
+                    len(payload),
+                    now,
+                    ttl or self.ttls.get(endpoint, 600),
+                    now,
+                    validators.get("etag"),
+                    validators.get("last_modified"),
+                ),
+            )
+            conn.commit()
+        self._remember((endpoint, location), data)
+
+        with self._lock:
+            self._puts += 1
+            due = self._puts % self.EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def touch(self, endpoint, location):
+        """Restart an entry's TTL after the server confirmed it is unchanged"""
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE responses SET fetched_at = ?, last_access = ? "
+                "WHERE endpoint = ? AND location = ?",
+                (now, now, endpoint, location),
+            )
+            conn.commit()
+
+    def delete(self, endpoint, location):
+        """Remove a single entry"""
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM responses WHERE endpoint = ? AND location = ?",
+                (endpoint, location),
+            )
+            conn.commit()
+        with self._lock:
+            self._decoded.pop((endpoint, location), None)
+
+    def read_through(self, endpoint, location, fetch, is_transient=None):
+        """Serve a fresh entry, or revalidate it with fetch() and store the result
+
+        fetch(validators) receives the stored validators of an expired entry
+        ({} if there is none) and returns either (data, validators) or
+        NOT_MODIFIED. If fetch() raises and `is_transient(error)` is true
+        (default: always), an expired entry is served instead so the app
+        keeps working offline.
+        """
+        row = self._metadata(endpoint, location)
+        if row is not None and time.time() - row[0] < row[1]:
+            data = self.get(endpoint, location, allow_expired=True)
+            if data is not None:
+                logger.info(f"Serving {endpoint} data for {location} from disk cache")
+                return data
+            # get() dropped an unreadable entry; fetch it whole
+            row = None
+
+        validators = {"etag": row[2], "last_modified": row[3]} if row else {}
+        try:
+            result = fetch(validators)
+            if result is NOT_MODIFIED:
+                logger.info(f"{endpoint} data for {location} not modified")
+                self.touch(endpoint, location)
+                data = self.get(endpoint, location, allow_expired=True)
+                if data is not None:
+                    return data
+                # Entry vanished between the check and the 304; fetch it whole
+                result = fetch({})
+        except Exception as e:
+            if is_transient is None or is_transient(e):
+                stale = self.get(endpoint, location, allow_expired=True)
+                if stale is not None:
+                    logger.warning(
+                        f"Serving expired {endpoint} data for {location}: {str(e)}"
+                    )
+                    return stale
+            raise
+
+        data, validators = result
+        self.put(endpoint, location, data, validators=validators)
+        return data
+
+    def evict(self):
+        """Drop old entries and trim the cache to `max_bytes`, then vacuum"""
+        now = time.time()
+        with self._connect() as conn:
+            removed = conn.execute(
+                "DELETE FROM responses WHERE last_access < ?", (now - self.max_age,)
+            ).rowcount
+
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total > self.max_bytes:
+                rows = conn.execute(
+                    "SELECT endpoint, location, size FROM responses "
+                    "ORDER BY last_access"
+                ).fetchall()
+                for endpoint, location, size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    conn.execute(
+                        "DELETE FROM responses WHERE endpoint = ? AND location = ?",
+                        (endpoint, location),
+                    )
+                    total -= size
+                    removed += 1
+            conn.commit()
+
+        if removed:
+            logger.info(f"Evicted {removed} entries from disk cache")
+            with self._lock:
+                self._decoded.clear()
+            conn = sqlite3.connect(self.db_path, timeout=10, isolation_level=None)
+            try:
+                conn.execute("VACUUM")
+            except sqlite3.OperationalError as e:
+                # Another connection is busy; the next pass will retry
+                logger.debug(f"Skipped disk cache vacuum: {e}")
+            finally:
+                conn.close()
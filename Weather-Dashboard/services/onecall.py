@@ -0,0 +1,128 @@
+"""Split a OneCall payload into the shapes of the /weather and /forecast APIs.
+
+The GUI code was written against the separate current-weather and 5-day
+forecast responses; these helpers let a single OneCall request feed it.
+"""
+
+FORECAST_STEP = 3 * 60 * 60  # the /forecast API reports every 3 hours
+
+
+def _wind(source):
+    wind = {"speed": source.get("wind_speed", 0), "deg": source.get("wind_deg", 0)}
+    if "wind_gust" in source:
+        wind["gust"] = source["wind_gust"]
+    return wind
+
+
+def _add_hour_precipitation(entry, hour):
+    """Fold an hourly point's 1h rain and snow into an entry's 3h totals"""
+    for key in ("rain", "snow"):
+        amount = hour.get(key, {}).get("1h", 0.0)
+        if amount:
+            entry[key]["3h"] += amount
+
+
+def current_from_onecall(payload, place):
+    """Build a /weather-shaped dict from a OneCall payload"""
+    current = payload["current"]
+    today = payload.get("daily", [{}])[0].get("temp", {})
+    return {
+        "coord": {"lat": payload["lat"], "lon": payload["lon"]},
+        "name": place.get("name", ""),
+        "dt": current["dt"],
+        "timezone": payload.get("timezone_offset", 0),
+        "weather": current.get("weather", []),
+        "main": {
+            "temp": current["temp"],
+            "feels_like": current.get("feels_like", current["temp"]),
+            "temp_min": today.get("min", current["temp"]),
+            "temp_max": today.get("max", current["temp"]),
+            "humidity": current.get("humidity", 0),
+            "pressure": current.get("pressure", 0),
+        },
+        "wind": _wind(current),
+        "visibility": current.get("visibility", 0),
+        "sys": {
+            "country": place.get("country", ""),
+            "sunrise": current.get("sunrise"),
+            "sunset": current.get("sunset"),
+        },
+    }
+
+
+def forecast_from_onecall(payload, place):
+    """Build a /forecast-shaped dict from a OneCall payload
+
+    Hourly points are thinned to the 3-hour spacing of the /forecast API,
+    each kept point carrying the rain and snow of the hours it stands for
+    as a "3h" total; days beyond the hourly range contribute one point
+    each from `daily`. Spacing therefore widens from 3 to 24 hours
+    part way through, and charts place points by "dt" rather than index.
+    """
+    entries = []
+    last_dt = None
+    for hour in payload.get("hourly", []):
+        if last_dt is not None and hour["dt"] - last_dt < FORECAST_STEP:
+            _add_hour_precipitation(entries[-1], hour)
+            continue
+        entries.append(
+            {
+                "dt": hour["dt"],
+                "main": {
+                    "temp": hour["temp"],
+                    "feels_like": hour.get("feels_like", hour["temp"]),
+                    "humidity": hour.get("humidity", 0),
+                    "pressure": hour.get("pressure", 0),
+                },
+                "weather": hour.get("weather", []),
+                "wind": _wind(hour),
+                "pop": hour.get("pop", 0),
+                "rain": {"3h": 0.0},
+                "snow": {"3h": 0.0},
+            }
+        )
+        _add_hour_precipitation(entries[-1], hour)
+        last_dt = hour["dt"]
+
+    for day in payload.get("daily", []):
+        if last_dt is not None and day["dt"] <= last_dt:
+            continue
+        temp = day.get("temp", {})
+        entries.append(
+            {
+                "dt": day["dt"],
+                "main": {
+                    "temp": temp.get("day", 0),
+                    "feels_like": day.get("feels_like", {}).get("day", 0),
+                    "temp_min": temp.get("min", temp.get("day", 0)),
+                    "temp_max": temp.get("max", temp.get("day", 0)),
+                    "humidity": day.get("humidity", 0),
+                    "pressure": day.get("pressure", 0),
+                },
+                "weather": day.get("weather", []),
+                "wind": _wind(day),
+                "pop": day.get("pop", 0),
+                "rain": day.get("rain", 0),
+                "snow": day.get("snow", 0),
+            }
+        )
+
+    return {
+        "cnt": len(entries),
+        "list": entries,
+        "city": {
+            "name": place.get("name", ""),
+            "country": place.get("country", ""),
+            "coord": {"lat": payload["lat"], "lon": payload["lon"]},
+            "timezone": payload.get("timezone_offset", 0),
+        },
+    }
+
+
+def split_onecall(payload, place):
+    """Return the {'current', 'forecast', 'uv_index'} bundle for a payload"""
+    return {
+        "current": current_from_onecall(payload, place),
+        "forecast": forecast_from_onecall(payload, place),
+        "uv_index": payload["current"].get("uvi"),
+    }
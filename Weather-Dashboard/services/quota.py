@@ -0,0 +1,213 @@
+import contextvars
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+import requests
+from utils.logger import logger
+from config.constants import (
+    API_QUOTAS,
+    PREFERENCES_DB_PATH,
+    QUOTA_MAX_WAIT,
+    QUOTA_PRESSURE,
+)
+
+FOREGROUND = "foreground"
+BACKGROUND = "background"
+
+request_priority = contextvars.ContextVar("request_priority", default=FOREGROUND)
+
+
+@contextmanager
+def background_priority():
+    """Mark requests made inside the block as deferrable background work"""
+    token = request_priority.set(BACKGROUND)
+    try:
+        yield
+    finally:
+        request_priority.reset(token)
+
+
+class QuotaExceededError(requests.exceptions.RequestException):
+    """Raised instead of sending a request that would exceed the API quota"""
+
+    def __init__(self, message, retry_after=None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def parse_retry_after(value):
+    """Return the Retry-After header as seconds from now, or None"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class TokenBucket:
+    """Classic token bucket refilled continuously at `rate` tokens/second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def _refill(self, now):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_take(self, now, reserve=0):
+        """Take a token if more than `reserve` remain; return the wait otherwise"""
+        self._refill(now)
+        if self.tokens - reserve >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 + reserve - self.tokens) / self.rate
+
+
+class QuotaGovernor:
+    """Paces API calls per host to stay inside the provider's quotas.
+
+    Each configured host gets a per-minute token bucket plus optional daily
+    and monthly budgets whose counters live in the preferences database, so
+    they survive restarts. A Retry-After from the server blocks the host
+    until it expires. Background calls (see background_priority) are
+    refused once a budget passes QUOTA_PRESSURE or the bucket runs low,
+    leaving the remaining headroom to user-initiated refreshes and letting
+    callers fall back to cached data.
+    """
+
+    def __init__(
+        self, db_path=PREFERENCES_DB_PATH, quotas=None, max_wait=QUOTA_MAX_WAIT
+    ):
+        self.db_path = db_path
+        self.quotas = quotas if quotas is not None else API_QUOTAS
+        self.max_wait = max_wait
+        self._buckets = {
+            host: TokenBucket(quota["per_minute"] / 60, quota["per_minute"])
+            for host, quota in self.quotas.items()
+            if quota.get("per_minute")
+        }
+        self._blocked_until = {}
+        self._lock = threading.Lock()
+        self.setup_database()
+
+    def setup_database(self):
+        """Create the usage table if it doesn't exist"""
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS api_usage (
+                    host TEXT,
+                    period TEXT,
+                    calls INTEGER,
+                    PRIMARY KEY (host, period)
+                )
+            """
+            )
+            conn.commit()
+
+    def _periods(self):
+        now = datetime.now()
+        return {"daily": now.strftime("%Y-%m-%d"), "monthly": now.strftime("%Y-%m")}
+
+    def usage(self, host):
+        """Return {'daily': n, 'monthly': n} call counts for a host"""
+        periods = self._periods()
+        with sqlite3.connect(self.db_path) as conn:
+            rows = dict(
+                conn.execute(
+                    "SELECT period, calls FROM api_usage WHERE host = ? AND period IN (?, ?)",
+                    (host, periods["daily"], periods["monthly"]),
+                ).fetchall()
+            )
+        return {name: rows.get(period, 0) for name, period in periods.items()}
+
+    def _record_call(self, host):
+        with sqlite3.connect(self.db_path) as conn:
+            for period in self._periods().values():
+                conn.execute(
+                    """INSERT INTO api_usage (host, period, calls) VALUES (?, ?, 1)
+                       ON CONFLICT (host, period) DO UPDATE SET calls = calls + 1""",
+                    (host, period),
+                )
+            conn.commit()
+
+    def acquire(self, host):
+        """Reserve one call to host, waiting briefly for a token if needed
+
+        Raises QuotaExceededError when the call should not be made now.
+        """
+        quota = self.quotas.get(host)
+        if quota is None:
+            return
+
+        background = request_priority.get() == BACKGROUND
+        usage = self.usage(host)
+        for name in ("daily", "monthly"):
+            limit = quota.get(name)
+            if not limit:
+                continue
+            if usage[name] >= limit:
+                raise QuotaExceededError(
+                    f"{name.capitalize()} API budget for {host} used up"
+                )
+            if background and usage[name] >= limit * QUOTA_PRESSURE:
+                raise QuotaExceededError(
+                    f"{name.capitalize()} API budget for {host} nearly used up, "
+                    "deferring background refresh"
+                )
+
+        deadline = time.monotonic() + (0 if background else self.max_wait)
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                blocked = self._blocked_until.get(host, 0) - now
+                if blocked > 0:
+                    raise QuotaExceededError(
+                        f"{host} asked us to back off", retry_after=blocked
+                    )
+                bucket = self._buckets.get(host)
+                if bucket is None:
+                    wait = 0.0
+                else:
+                    # Background calls leave a quarter of the bucket to the user
+                    reserve = bucket.capacity * 0.25 if background else 0
+                    wait = bucket.try_take(now, reserve)
+            if wait == 0:
+                break
+            if now + wait > deadline:
+                raise QuotaExceededError(
+                    f"Rate limit for {host} reached", retry_after=wait
+                )
+            time.sleep(wait)
+
+        self._record_call(host)
+
+    def observe(self, host, response):
+        """Honor Retry-After on 429 / 503 replies"""
+        if response.status_code not in (429, 503):
+            return
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            if response.status_code != 429:
+                return
+            retry_after = 60.0
+        logger.warning(
+            f"{host} returned {response.status_code}, pausing {retry_after:.0f}s"
+        )
+        with self._lock:
+            self._blocked_until[host] = time.monotonic() + retry_after
+            bucket = self._buckets.get(host)
+            if bucket is not None:
+                bucket.tokens = 0
@@ -0,0 +1,176 @@
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from utils.logger import logger
+from services.cassette import install_cassette
+from config.constants import (
+    HTTP_TIMEOUT,
+    HTTP_RETRIES,
+    HTTP_BACKOFF,
+    HTTP_MAX_BACKOFF,
+    HTTP_POOL_SIZE,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_RESET_TIMEOUT,
+    CASSETTE_PATH,
+    CASSETTE_MODE,
+    REPLAY_SPEED,
+)
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without touching the network while a host's circuit is open"""
+
+
+class CircuitBreaker:
+    """Trips after consecutive failures and fails fast until a cooldown passes.
+
+    Once the cooldown has elapsed a single probe request is let through;
+    its outcome closes the circuit again or restarts the cooldown.
+    """
+
+    def __init__(
+        self,
+        failure_threshold=CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout=CIRCUIT_RESET_TIMEOUT,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._probe_thread = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True if a request may be attempted now"""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._probing:
+                return False
+            if time.monotonic() - self.opened_at >= self.reset_timeout:
+                self._probing = True
+                self._probe_thread = threading.get_ident()
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def release(self):
+        """Hand back this thread's probe if it ended without a verdict"""
+        with self._lock:
+            if self._probing and self._probe_thread == threading.get_ident():
+                self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+            self._probing = False
+
+
+class ResilientSession(requests.Session):
+    """requests.Session with a sized connection pool, default timeouts,
+    jittered retries for connection errors and 5xx replies, and a circuit
+    breaker per host. An optional QuotaGovernor is consulted before every
+    attempt, retries included. Setting WEATHER_CASSETTE records all traffic
+    to, or replays it from, a cassette file.
+    """
+
+    def __init__(
+        self,
+        timeout=HTTP_TIMEOUT,
+        retries=HTTP_RETRIES,
+        backoff=HTTP_BACKOFF,
+        max_backoff=HTTP_MAX_BACKOFF,
+        pool_size=HTTP_POOL_SIZE,
+        governor=None,
+    ):
+        super().__init__()
+        self.governor = governor
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount("http://", adapter)
+        self.mount("https://", adapter)
+
+        if CASSETTE_PATH:
+            install_cassette(
+                self, CASSETTE_PATH, CASSETTE_MODE, REPLAY_SPEED, pool_size
+            )
+            if CASSETTE_MODE == "replay":
+                # Replayed traffic never reaches the API, so don't pace it
+                self.governor = None
+
+    def breaker_for(self, host):
+        """Return the circuit breaker for a host, creating it on first use"""
+        with self._breakers_lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = self._breakers[host] = CircuitBreaker()
+            return breaker
+
+    def backoff_delay(self, attempt):
+        """Full-jitter exponential backoff for the given retry attempt"""
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2**attempt))
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        host = urlsplit(url).hostname
+        breaker = self.breaker_for(host)
+
+        for attempt in range(self.retries + 1):
+            # Quota first: a refusal here must not strand a half-open probe
+            if self.governor is not None:
+                self.governor.acquire(host)
+
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {host}, skipping request")
+
+            last_attempt = attempt == self.retries
+            recorded = False
+            try:
+                response = super().request(method, url, **kwargs)
+            except (
+                requests.exceptions.ConnectionError,
+                requests.exceptions.Timeout,
+            ) as e:
+                breaker.record_failure()
+                recorded = True
+                if last_attempt:
+                    raise
+                logger.warning(f"Request to {host} failed ({str(e)}), retrying")
+            else:
+                if self.governor is not None:
+                    self.governor.observe(host, response)
+                recorded = True
+                if response.status_code < 500:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if last_attempt:
+                    return response
+                logger.warning(
+                    f"Request to {host} returned {response.status_code}, retrying"
+                )
+                response.close()
+            finally:
+                # Errors that say nothing about the host (bad URL, cassette
+                # miss) must not leave a probe pending forever
+                if not recorded:
+                    breaker.release()
+
+            time.sleep(self.backoff_delay(attempt))
@@ -1,21 +1,86 @@
+import threading
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from utils.logger import logger
-from config.constants import BASE_URL, FORECAST_URL
+from services.cache import normalize_location
+from services.single_flight import SingleFlight
+from services.transport import ResilientSession
+from services.quota import QuotaGovernor, QuotaExceededError
+from services.disk_cache import (
+    NOT_MODIFIED,
+    conditional_headers,
+    response_validators,
+)
+from services.onecall import split_onecall
+from config.constants import (
+    BASE_URL,
+    FORECAST_URL,
+    ONECALL_URL,
+    DIRECT_GEOCODING_URL,
+    CACHE_MAX_ENTRIES,
+)
+
+
+def is_transient_error(error):
+    """True for failures worth riding out with cached data"""
+    if isinstance(error, requests.exceptions.HTTPError):
+        response = error.response
+        return response is None or response.status_code >= 500
+    return isinstance(
+        error,
+        (
+            requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            QuotaExceededError,
+        ),
+    )
 
 
 class WeatherService:
-    def __init__(self, api_key):
+    def __init__(self, api_key, session=None, disk_cache=None):
         self.api_key = api_key
-        self.session = requests.Session()
+        self.session = session or ResilientSession(governor=QuotaGovernor())
+        self.disk_cache = disk_cache
+        self.inflight = SingleFlight()
+        self._places = {}
+        self._bundles = OrderedDict()
+        self._bundles_lock = threading.Lock()
+
+    def _get_json(self, endpoint, key, url, params, **kwargs):
+        """GET a JSON payload, reading through the disk cache when configured
+
+        Concurrent requests for the same (endpoint, key) share one call.
+        Expired cache entries are revalidated with a conditional request; a
+        304 returns the cached object without downloading or decoding.
+        """
+
+        def fetch(validators):
+            response = self.session.get(
+                url, params=params, headers=conditional_headers(validators), **kwargs
+            )
+            if response.status_code == 304:
+                return NOT_MODIFIED
+            response.raise_for_status()
+            return response.json(), response_validators(response)
+
+        def read():
+            if self.disk_cache is None:
+                return fetch({})[0]
+            return self.disk_cache.read_through(
+                endpoint, key, fetch, is_transient=is_transient_error
+            )
+
+        return self.inflight.do((endpoint, key), read)
 
     def get_current_weather(self, location):
         """Fetch current weather data"""
         try:
             logger.info(f"Fetching weather data for location: {location}")
             params = {"appid": self.api_key, "q": location}
-            response = self.session.get(BASE_URL, params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(
+                "current", normalize_location(location), BASE_URL, params
+            )
         except Exception as e:
             logger.error(f"Error fetching weather: {str(e)}")
             raise
@@ -25,9 +90,112 @@ class WeatherService:
         try:
             logger.info(f"Fetching forecast for location: {location}")
             params = {"appid": self.api_key, "q": location}
-            response = self.session.get(FORECAST_URL, params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(
+                "forecast", normalize_location(location), FORECAST_URL, params
+            )
         except Exception as e:
             logger.error(f"Error fetching forecast: {str(e)}")
             raise
+
+    def get_uv_index(self, lat, lon):
+        """Fetch UV index for a coordinate pair, None if unavailable"""
+        try:
+            logger.info(f"Fetching UV index for coordinates: {lat}, {lon}")
+            params = {
+                "appid": self.api_key,
+                "lat": lat,
+                "lon": lon,
+                "exclude": "minutely,hourly,daily,alerts",
+            }
+            data = self._get_json(
+                "uv", f"{lat:.2f},{lon:.2f}", ONECALL_URL, params, timeout=5
+            )
+            return data.get("current", {}).get("uvi")
+        except Exception as e:
+            logger.warning(f"Error fetching UV index: {str(e)}")
+            return None
+
+    def resolve_location(self, location):
+        """Resolve a location name to {'name', 'country', 'lat', 'lon'}
+
+        Results are kept for the life of the service (and in the disk
+        cache, when configured) since coordinates don't change.
+        """
+        key = normalize_location(location)
+        place = self._places.get(key)
+        if place is None:
+            logger.info(f"Resolving coordinates for location: {location}")
+            params = {"appid": self.api_key, "q": location, "limit": 1}
+            matches = self._get_json("geo", key, DIRECT_GEOCODING_URL, params)
+            if not matches:
+                raise ValueError(f"City not found: {location}")
+            place = {
+                "name": matches[0].get("name", location),
+                "country": matches[0].get("country", ""),
+                "lat": matches[0]["lat"],
+                "lon": matches[0]["lon"],
+            }
+            self._places[key] = place
+        return place
+
+    def get_consolidated(self, location):
+        """Fetch current, hourly, daily and UV data in a single OneCall request
+
+        Returns {'current', 'forecast', 'uv_index'} with `current` and
+        `forecast` shaped like the /weather and /forecast responses. The
+        split is reused while the underlying payload is unchanged, so
+        callers can skip redraws by identity.
+        """
+        try:
+            place = self.resolve_location(location)
+            logger.info(f"Fetching consolidated weather for location: {location}")
+            params = {
+                "appid": self.api_key,
+                "lat": place["lat"],
+                "lon": place["lon"],
+                "exclude": "minutely,alerts",
+            }
+            key = f"{place['lat']:.2f},{place['lon']:.2f}"
+            payload = self._get_json("onecall", key, ONECALL_URL, params)
+        except Exception as e:
+            logger.error(f"Error fetching consolidated weather: {str(e)}")
+            raise
+
+        with self._bundles_lock:
+            cached = self._bundles.get(key)
+            if cached is not None and cached[0] is payload:
+                self._bundles.move_to_end(key)
+                return cached[1]
+
+        bundle = split_onecall(payload, place)
+        with self._bundles_lock:
+            self._bundles[key] = (payload, bundle)
+            while len(self._bundles) > CACHE_MAX_ENTRIES:
+                self._bundles.popitem(last=False)
+        return bundle
+
+    def fetch_many(self, locations, max_workers=8, fetch=None):
+        """Fetch several locations at once, yielding results as they complete
+
+        Yields (location, data, error) tuples in completion order. `fetch`
+        defaults to get_current_weather. A failure for one location is
+        reported through `error` and does not stop the others.
+        """
+        fetch = fetch or self.get_current_weather
+        executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="weather-fetch"
+        )
+        try:
+            futures = {
+                executor.submit(fetch, location): location for location in locations
+            }
+            for future in as_completed(futures):
+                location = futures[future]
+                try:
+                    yield location, future.result(), None
+                except Exception as e:
+                    logger.warning(f"Fetch failed for {location}: {str(e)}")
+                    yield location, None, e
+        finally:
+            # Don't keep fetching if the caller stopped consuming early
+            executor.shutdown(wait=False, cancel_futures=True)
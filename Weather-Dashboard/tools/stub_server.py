@@ -0,0 +1,531 @@
+"""Local stand-in for the OpenWeatherMap and ip-api endpoints.
+
+Serves deterministic synthetic payloads for thousands of cities so the fetch
+layer can be load-tested and benchmarked offline:
+
+    python tools/stub_server.py --port 8080 --cities 5000 \\
+        --latency lognormal:80,0.5 --fault 429=0.01 --fault 500=0.02 \\
+        --bandwidth 64k
+
+    WEATHER_API_BASE=http://127.0.0.1:8080 IP_API_BASE=http://127.0.0.1:8080 \\
+        python weather-dashboard.py
+
+Cities are named Synth00000, Synth00001, ... Payloads stay identical within
+a 10-minute window and carry an ETag, so conditional requests get 304s.
+GET /_stats returns request counts and latency percentiles.
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+UPDATE_INTERVAL = 600  # seconds a payload stays unchanged
+COUNTRIES = ["GB", "US", "DE", "FR", "JP", "BR", "IN", "AU", "CA", "ZA", "GH", "NO"]
+CONDITIONS = [
+    (800, "Clear", "clear sky", "01"),
+    (801, "Clouds", "few clouds", "02"),
+    (802, "Clouds", "scattered clouds", "03"),
+    (803, "Clouds", "broken clouds", "04"),
+    (804, "Clouds", "overcast clouds", "04"),
+    (500, "Rain", "light rain", "10"),
+    (501, "Rain", "moderate rain", "10"),
+    (502, "Rain", "heavy intensity rain", "10"),
+    (300, "Drizzle", "light intensity drizzle", "09"),
+    (211, "Thunderstorm", "thunderstorm", "11"),
+    (600, "Snow", "light snow", "13"),
+    (601, "Snow", "snow", "13"),
+    (701, "Mist", "mist", "50"),
+    (741, "Fog", "fog", "50"),
+]
+
+
+def parse_latency(spec):
+    """Parse 'fixed:MS', 'uniform:LO,HI', 'normal:MEAN,SD' or
+    'lognormal:MEDIAN,SIGMA' into a function returning seconds"""
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v]
+    if kind == "fixed":
+        return lambda rng: values[0] / 1000
+    if kind == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == "normal":
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == "lognormal":
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000
+    raise argparse.ArgumentTypeError(f"Unknown latency distribution: {spec}")
+
+
+def parse_fault(spec):
+    """Parse 'STATUS=PROBABILITY', e.g. '429=0.01'"""
+    status, _, probability = spec.partition("=")
+    return int(status), float(probability)
+
+
+def parse_bandwidth(spec):
+    """Parse a byte rate such as '64k' or '2m' (bytes per second)"""
+    multipliers = {"k": 1024, "m": 1024 * 1024}
+    spec = spec.lower()
+    if spec[-1] in multipliers:
+        return int(float(spec[:-1]) * multipliers[spec[-1]])
+    return int(spec)
+
+
+class CityCatalog:
+    """Deterministic set of synthetic cities"""
+
+    def __init__(self, count, seed=42):
+        rng = random.Random(seed)
+        self.cities = []
+        self.by_name = {}
+        for i in range(count):
+            city = {
+                "id": 100000 + i,
+                "name": f"Synth{i:05d}",
+                "country": COUNTRIES[i % len(COUNTRIES)],
+                "lat": round(rng.uniform(-60, 70), 4),
+                "lon": round(rng.uniform(-180, 180), 4),
+            }
+            city["timezone"] = int(round(city["lon"] / 15)) * 3600
+            self.cities.append(city)
+            self.by_name[city["name"].lower()] = city
+
+        # Grid index for nearest(): cells sized for about two cities each
+        self.cell = max(1.0, math.sqrt(130 * 360 * 2 / max(count, 1)))
+        self.grid = {}
+        for city in self.cities:
+            self.grid.setdefault(self.cell_of(city["lat"], city["lon"]), []).append(
+                city
+            )
+        rows = [row for row, _ in self.grid] or [0]
+        cols = [col for _, col in self.grid] or [0]
+        self.bounds = (min(rows), max(rows), min(cols), max(cols))
+
+    def cell_of(self, lat, lon):
+        return (math.floor(lat / self.cell), math.floor(lon / self.cell))
+
+    def find(self, query):
+        name = query.split(",")[0].strip().lower()
+        return self.by_name.get(name)
+
+    def nearest(self, lat, lon):
+        """Closest city, searching grid rings outward from the query's cell
+
+        Every city beyond ring r is at least r cells away, so the search
+        stops once the best match is closer than that.
+        """
+        row, col = self.cell_of(lat, lon)
+        min_row, max_row, min_col, max_col = self.bounds
+        last_ring = max(row - min_row, max_row - row, col - min_col, max_col - col)
+        best, best_d2 = None, float("inf")
+        for ring in range(last_ring + 1):
+            for r in range(row - ring, row + ring + 1):
+                edge = r in (row - ring, row + ring)
+                for c in range(col - ring, col + ring + 1):
+                    if not edge and c not in (col - ring, col + ring):
+                        continue
+                    for city in self.grid.get((r, c), ()):
+                        d2 = (city["lat"] - lat) ** 2 + (city["lon"] - lon) ** 2
+                        if d2 < best_d2:
+                            best, best_d2 = city, d2
+            if best is not None and best_d2 <= (ring * self.cell) ** 2:
+                break
+        return best
+
+
+class WeatherModel:
+    """Generates plausible, time-stable weather for a city"""
+
+    def __init__(self, city, window):
+        self.city = city
+        self.window = window
+        self.rng = random.Random(f"{city['id']}:{window}")
+        self.base_temp = 273.15 + 28 - abs(city["lat"]) * 0.45
+
+    def temp_at(self, ts):
+        local_hour = ((ts + self.city["timezone"]) % 86400) / 3600
+        diurnal = 6 * math.sin((local_hour - 9) / 24 * 2 * math.pi)
+        return round(self.base_temp + diurnal + self.rng.uniform(-1.5, 1.5), 2)
+
+    def condition(self):
+        cid, main, description, icon = self.rng.choice(CONDITIONS)
+        return [
+            {"id": cid, "main": main, "description": description, "icon": icon + "d"}
+        ]
+
+    def sample(self, ts):
+        temp = self.temp_at(ts)
+        return {
+            "temp": temp,
+            "feels_like": round(temp - self.rng.uniform(0, 3), 2),
+            "humidity": self.rng.randint(30, 95),
+            "pressure": self.rng.randint(990, 1035),
+            "wind_speed": round(self.rng.uniform(0, 12), 2),
+            "wind_deg": self.rng.randint(0, 359),
+            "wind_gust": round(self.rng.uniform(0, 18), 2),
+            "weather": self.condition(),
+        }
+
+    def sun(self, ts):
+        day_start = ts - (ts + self.city["timezone"]) % 86400
+        return day_start + 6 * 3600, day_start + 18 * 3600
+
+
+def current_payload(city, window, now):
+    model = WeatherModel(city, window)
+    s = model.sample(now)
+    sunrise, sunset = model.sun(now)
+    return {
+        "coord": {"lon": city["lon"], "lat": city["lat"]},
+        "weather": s["weather"],
+        "base": "stations",
+        "main": {
+            "temp": s["temp"],
+            "feels_like": s["feels_like"],
+            "temp_min": round(s["temp"] - 2, 2),
+            "temp_max": round(s["temp"] + 2, 2),
+            "pressure": s["pressure"],
+            "humidity": s["humidity"],
+        },
+        "visibility": 10000,
+        "wind": {
+            "speed": s["wind_speed"],
+            "deg": s["wind_deg"],
+            "gust": s["wind_gust"],
+        },
+        "clouds": {"all": model.rng.randint(0, 100)},
+        "dt": now,
+        "sys": {"country": city["country"], "sunrise": sunrise, "sunset": sunset},
+        "timezone": city["timezone"],
+        "id": city["id"],
+        "name": city["name"],
+        "cod": 200,
+    }
+
+
+def forecast_payload(city, window, now):
+    model = WeatherModel(city, window)
+    start = now - now % 10800 + 10800
+    entries = []
+    for i in range(40):
+        ts = start + i * 10800
+        s = model.sample(ts)
+        entries.append(
+            {
+                "dt": ts,
+                "main": {
+                    "temp": s["temp"],
+                    "feels_like": s["feels_like"],
+                    "temp_min": s["temp"],
+                    "temp_max": s["temp"],
+                    "pressure": s["pressure"],
+                    "humidity": s["humidity"],
+                },
+                "weather": s["weather"],
+                "wind": {
+                    "speed": s["wind_speed"],
+                    "deg": s["wind_deg"],
+                    "gust": s["wind_gust"],
+                },
+                "visibility": 10000,
+                "pop": round(model.rng.random(), 2),
+                "dt_txt": time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts)),
+            }
+        )
+    return {
+        "cod": "200",
+        "message": 0,
+        "cnt": len(entries),
+        "list": entries,
+        "city": {
+            "id": city["id"],
+            "name": city["name"],
+            "coord": {"lat": city["lat"], "lon": city["lon"]},
+            "country": city["country"],
+            "timezone": city["timezone"],
+        },
+    }
+
+
+def onecall_payload(city, window, now, exclude):
+    model = WeatherModel(city, window)
+    payload = {
+        "lat": city["lat"],
+        "lon": city["lon"],
+        "timezone": "Etc/Synthetic",
+        "timezone_offset": city["timezone"],
+    }
+    if "current" not in exclude:
+        s = model.sample(now)
+        sunrise, sunset = model.sun(now)
+        payload["current"] = dict(
+            s,
+            dt=now,
+            sunrise=sunrise,
+            sunset=sunset,
+            uvi=round(model.rng.uniform(0, 11), 2),
+            visibility=10000,
+        )
+    if "hourly" not in exclude:
+        start = now - now % 3600
+        payload["hourly"] = [
+            dict(model.sample(start + h * 3600), dt=start + h * 3600) for h in range(48)
+        ]
+    if "daily" not in exclude:
+        start = now - (now + city["timezone"]) % 86400 + 12 * 3600
+        daily = []
+        for d in range(8):
+            ts = start + d * 86400
+            s = model.sample(ts)
+            daily.append(
+                dict(
+                    s,
+                    dt=ts,
+                    temp={
+                        "day": s["temp"],
+                        "min": round(s["temp"] - 5, 2),
+                        "max": round(s["temp"] + 3, 2),
+                    },
+                    feels_like={"day": s["feels_like"]},
+                    pop=round(model.rng.random(), 2),
+                    uvi=round(model.rng.uniform(0, 11), 2),
+                )
+            )
+        payload["daily"] = daily
+    return payload
+
+
+class StubState:
+    def __init__(self, args):
+        self.catalog = CityCatalog(args.cities, seed=args.seed)
+        self.latency = args.latency
+        self.faults = args.fault
+        self.bandwidth = args.bandwidth
+        self.rng = random.Random(args.seed)
+        self.lock = threading.Lock()
+        self.counts = {}
+        self.durations = []
+
+    def record(self, path, status, duration):
+        with self.lock:
+            key = f"{path} {status}"
+            self.counts[key] = self.counts.get(key, 0) + 1
+            self.durations.append(duration)
+
+    def stats(self):
+        with self.lock:
+            durations = sorted(self.durations)
+            counts = dict(self.counts)
+
+        def percentile(p):
+            if not durations:
+                return None
+            return round(
+                durations[min(len(durations) - 1, int(p * len(durations)))] * 1000, 2
+            )
+
+        return {
+            "requests": sum(counts.values()),
+            "by_path_status": counts,
+            "latency_ms": {
+                "p50": percentile(0.5),
+                "p90": percentile(0.9),
+                "p99": percentile(0.99),
+                "max": percentile(1.0),
+            },
+        }
+
+    def draw(self):
+        """Pick the injected delay and fault for one request"""
+        with self.lock:
+            delay = self.latency(self.rng) if self.latency else 0.0
+            for status, probability in self.faults:
+                if self.rng.random() < probability:
+                    return delay, status
+        return delay, None
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    state = None  # set by serve()
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+    def do_GET(self):
+        started = time.perf_counter()
+        url = urlsplit(self.path)
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        path = url.path.rstrip("/") or "/"
+
+        if path == "/_stats":
+            self.send_json(200, self.state.stats())
+            return
+
+        delay, fault = self.state.draw()
+        if delay:
+            time.sleep(delay)
+
+        status = fault or 200
+        if fault:
+            self.send_fault(fault)
+        else:
+            status = self.route(path, params)
+        self.state.record(path, status, time.perf_counter() - started)
+
+    def route(self, path, params):
+        catalog = self.state.catalog
+        now = int(time.time())
+        window = now // UPDATE_INTERVAL
+
+        if path.startswith("/json"):
+            city = catalog.cities[0]
+            return self.send_json(
+                200,
+                {
+                    "status": "success",
+                    "country": city["country"],
+                    "countryCode": city["country"],
+                    "city": city["name"],
+                    "lat": city["lat"],
+                    "lon": city["lon"],
+                    "query": self.client_address[0],
+                },
+            )
+
+        if path.startswith("/data/2.5") or path.startswith("/geo"):
+            if not params.get("appid"):
+                return self.send_fault(401)
+
+        if path == "/geo/1.0/direct":
+            city = catalog.find(params.get("q", ""))
+            matches = []
+            if city:
+                matches.append({k: city[k] for k in ("name", "country", "lat", "lon")})
+            return self.send_json(200, matches)
+
+        if path in ("/data/2.5/weather", "/data/2.5/forecast"):
+            if "q" in params:
+                city = catalog.find(params["q"])
+            elif "lat" in params and "lon" in params:
+                try:
+                    lat, lon = float(params["lat"]), float(params["lon"])
+                except ValueError:
+                    return self.send_fault(400)
+                city = catalog.nearest(lat, lon)
+            else:
+                city = None
+            if city is None:
+                return self.send_fault(404)
+            build = current_payload if path.endswith("weather") else forecast_payload
+            return self.send_cacheable(
+                build(city, window, now), (path, city["id"], window)
+            )
+
+        if path == "/data/2.5/onecall":
+            try:
+                lat, lon = float(params["lat"]), float(params["lon"])
+            except (KeyError, ValueError):
+                return self.send_fault(400)
+            city = dict(catalog.nearest(lat, lon), lat=lat, lon=lon)
+            exclude = set(params.get("exclude", "").split(","))
+            return self.send_cacheable(
+                onecall_payload(city, window, now, exclude),
+                (path, lat, lon, window, params.get("exclude", "")),
+            )
+
+        return self.send_fault(404)
+
+    def send_cacheable(self, payload, identity):
+        etag = '"' + hashlib.sha1(repr(identity).encode()).hexdigest()[:16] + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return 304
+        return self.send_json(200, payload, {"ETag": etag})
+
+    def send_fault(self, status):
+        messages = {
+            400: "wrong latitude",
+            401: "Invalid API key. Please see https://openweathermap.org/faq#error401",
+            404: "city not found",
+            429: "Your account is temporary blocked due to exceeding of requests limitation",
+        }
+        headers = {"Retry-After": "1"} if status == 429 else {}
+        return self.send_json(
+            status,
+            {"cod": status, "message": messages.get(status, "Internal error")},
+            headers,
+        )
+
+    def send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+        rate = self.state.bandwidth
+        if not rate:
+            self.wfile.write(body)
+            return status
+        chunk = max(1, rate // 20)  # ~50 ms per chunk
+        for offset in range(0, len(body), chunk):
+            self.wfile.write(body[offset : offset + chunk])
+            time.sleep(chunk / rate)
+        return status
+
+
+def serve(args):
+    StubHandler.state = StubState(args)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    server.daemon_threads = True
+    print(f"Stub weather API listening on http://{args.host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--cities", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--latency",
+        type=parse_latency,
+        default=None,
+        help="fixed:MS, uniform:LO,HI, normal:MEAN,SD or lognormal:MEDIAN,SIGMA",
+    )
+    parser.add_argument(
+        "--fault",
+        type=parse_fault,
+        action="append",
+        default=[],
+        help="STATUS=PROBABILITY, e.g. 429=0.01 (repeatable)",
+    )
+    parser.add_argument(
+        "--bandwidth",
+        type=parse_bandwidth,
+        default=None,
+        help="per-response cap in bytes/second, e.g. 64k",
+    )
+    return parser
+
+
+if __name__ == "__main__":
+    serve(build_parser().parse_args())
@@ -6,6 +6,10 @@ from ui.components.weather_tab import WeatherTab
 from ui.components.forecast_tab import ForecastTab
 from models.user_preferences import UserPreferences
 from services.weather_service import WeatherService
+from services.cache import CachedWeatherService
+from services.disk_cache import DiskCache
+from models.weather import decode_current
+from utils.units import get_unit_system
 from config.constants import DEFAULT_WINDOW_SIZE, MIN_WINDOW_SIZE
 
 
@@ -25,7 +29,9 @@ class WeatherDashboard:
         self.notebook.add(self.weather_tab, text="Current Weather")
 
         self.setup_window()
-        self.weather_service = WeatherService(api_key)
+        self.weather_service = CachedWeatherService(
+            WeatherService(api_key, disk_cache=DiskCache())
+        )
         self.preferences = UserPreferences()
 
         self.setup_ui()
@@ -43,6 +49,11 @@ class WeatherDashboard:
         style.configure("tooltip.TLabel", background="#1a1a1a", foreground="white")
         style.configure("legend.TLabel", foreground="white")
 
+    @property
+    def units(self):
+        """UnitSystem for the preferred temperature unit"""
+        return get_unit_system(self.preferences.temperature_unit)
+
     def on_refresh(self):
         """Refresh weather data"""
         logger.info("Refreshing weather data")
@@ -82,7 +93,8 @@ class WeatherDashboard:
 
     def setup_bindings(self):
         """Setup event bindings"""
-        self.root.bind("<Configure>", self.on_window_resize)
+        # No root <Configure> binding: it fires for every child widget. Charts
+        # coalesce their own resizes through ResizeCoalescer.
 
     def setup_voice_controls(self):
         """Setup voice control button and functionality"""
@@ -121,23 +133,27 @@ class WeatherDashboard:
                 weather_data = self.weather_service.get_current_weather(
                     self.city_var.get()
                 )
-                self.voice_assistant.speak_weather(weather_data)
+                units = self.units
+                self.voice_assistant.speak_weather(
+                    units.convert_current(decode_current(weather_data)), units
+                )
 
             elif command_type == "forecast":
                 if location:
                     self.city_var.set(location)
                     self.refresh_weather()
                 forecast_data = self.weather_service.get_forecast(self.city_var.get())
-                self.voice_assistant.speak_forecast(forecast_data)
+                self.voice_assistant.speak_forecast(forecast_data, self.units)
                 self.notebook.select(1)  # Switch to forecast tab
 
             elif command_type == "temperature":
                 weather_data = self.weather_service.get_current_weather(
                     self.city_var.get()
                 )
-                temp = weather_data["main"]["temp"]
+                units = self.units
+                temp = units.temperature(decode_current(weather_data).temp)
                 self.voice_assistant.speak(
-                    f"The current temperature is {temp:.1f} degrees Celsius"
+                    f"The current temperature is {temp:.1f} {units.temp_name}"
                 )
 
         except Exception as e:
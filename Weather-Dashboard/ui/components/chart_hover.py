@@ -0,0 +1,119 @@
+class HitIndex:
+    """Uniform grid over chart points for constant-cost nearest lookups
+
+    Cells are `radius` wide, so any point within `radius` of the cursor
+    lies in the cursor's cell or one of its eight neighbours, however
+    many points (or series) the chart holds.
+    """
+
+    def __init__(self, points=(), radius=20):
+        self.radius = radius
+        self.cells = {}  # (column, row) -> [(x, y, key), ...]
+        for point in points:
+            self.add(*point)
+
+    def cell(self, x, y):
+        return int(x // self.radius), int(y // self.radius)
+
+    def add(self, x, y, key):
+        self.cells.setdefault(self.cell(x, y), []).append((x, y, key))
+
+    def nearest(self, x, y):
+        """(x, y, key) of the closest point within `radius`, or None"""
+        column, row = self.cell(x, y)
+        best = None
+        best_distance = self.radius * self.radius
+        for dc in (-1, 0, 1):
+            for dr in (-1, 0, 1):
+                for point in self.cells.get((column + dc, row + dr), ()):
+                    distance = (point[0] - x) ** 2 + (point[1] - y) ** 2
+                    if distance < best_distance:
+                        best, best_distance = point, distance
+        return best
+
+
+class ChartHover:
+    """Tooltip and highlight for a chart canvas, drawn with reused items
+
+    Motion events only record the cursor; the hit test runs at most once
+    per `frame_interval` ms. `describe(key)` returns the tooltip text for
+    a point registered with `set_points`.
+    """
+
+    def __init__(self, canvas, describe, radius=20, frame_interval=16):
+        self.canvas = canvas
+        self.describe = describe
+        self.frame_interval = frame_interval
+        self.index = HitIndex(radius=radius)
+        self.cursor = None
+        self.job = None
+        self.current = None  # point under the cursor
+
+        self.highlight = canvas.create_oval(
+            0, 0, 0, 0, outline="white", width=2, state="hidden", tags=("hover",)
+        )
+        self.tooltip_box = canvas.create_rectangle(
+            0, 0, 0, 0, fill="#1a1a1a", outline="", state="hidden", tags=("hover",)
+        )
+        self.tooltip_text = canvas.create_text(
+            0, 0, fill="white", anchor="nw", state="hidden", tags=("hover",)
+        )
+
+        canvas.bind("<Motion>", self.on_motion, add="+")
+        canvas.bind("<Leave>", self.on_leave, add="+")
+
+    def set_points(self, points):
+        """Replace the hoverable points, an iterable of (x, y, key)"""
+        self.index = HitIndex(points, self.index.radius)
+        self.hide()
+
+    def on_motion(self, event):
+        self.cursor = (event.x, event.y)
+        if self.job is None:
+            self.job = self.canvas.after(self.frame_interval, self.update)
+
+    def on_leave(self, event):
+        self.cancel()
+        self.hide()
+
+    def cancel(self):
+        if self.job is not None:
+            self.canvas.after_cancel(self.job)
+            self.job = None
+
+    def update(self):
+        self.job = None
+        point = self.index.nearest(*self.cursor)
+        if point == self.current:
+            return
+        if point is None:
+            self.hide()
+        else:
+            self.show(point)
+
+    def show(self, point):
+        """Move the highlight and tooltip onto a point"""
+        canvas = self.canvas
+        x, y, key = point
+        self.current = point
+        canvas.coords(self.highlight, x - 6, y - 6, x + 6, y + 6)
+        # Hidden text has no bbox, so show the items before measuring
+        canvas.itemconfigure("hover", state="normal")
+        canvas.itemconfigure(self.tooltip_text, text=self.describe(key))
+
+        # Place to the right of the point, flipping left near the edge
+        canvas.coords(self.tooltip_text, x + 14, y - 10)
+        canvas.itemconfigure(self.tooltip_text, anchor="nw")
+        left, top, right, bottom = canvas.bbox(self.tooltip_text)
+        if right + 5 > canvas.winfo_width():
+            canvas.coords(self.tooltip_text, x - 14, y - 10)
+            canvas.itemconfigure(self.tooltip_text, anchor="ne")
+            left, top, right, bottom = canvas.bbox(self.tooltip_text)
+        canvas.coords(self.tooltip_box, left - 5, top - 5, right + 5, bottom + 5)
+
+        canvas.tag_raise("hover")
+
+    def hide(self):
+        if self.current is not None:
+            self.canvas.itemconfigure("hover", state="hidden")
+            self.current = None
@@ -0,0 +1,70 @@
+class ChartScene:
+    """Retained canvas items for a chart, pooled by role
+
+    Items are created once per role and then moved and restyled in place.
+    The scene remembers what it last sent to Tk, so unchanged coordinates
+    and options cost nothing on a redraw. Items are only created or
+    deleted when a role's count changes.
+    """
+
+    def __init__(self, canvas, tag="scene"):
+        self.canvas = canvas
+        self.tag = tag
+        self.pools = {}  # role -> [item id, ...]
+        self.state = {}  # item id -> (coords, options)
+
+    def items(self, role, count, kind, **options):
+        """Return exactly `count` items of `role`, creating or deleting as needed
+
+        `kind` is a canvas item type ("line", "oval", "rectangle", "text",
+        "image")
+        and `options` are only used for newly created items.
+        """
+        pool = self.pools.setdefault(role, [])
+        while len(pool) < count:
+            create = getattr(self.canvas, f"create_{kind}")
+            coords = (0, 0) if kind in ("text", "image") else (0, 0, 0, 0)
+            pool.append(create(*coords, tags=(self.tag, role), **options))
+        while len(pool) > count:
+            item = pool.pop()
+            self.canvas.delete(item)
+            self.state.pop(item, None)
+        return pool
+
+    def item(self, role, kind, **options):
+        """The single item of `role`"""
+        return self.items(role, 1, kind, **options)[0]
+
+    def update(self, item, coords=None, **options):
+        """Move and restyle one item, skipping whatever did not change"""
+        last_coords, last_options = self.state.get(item, (None, {}))
+        if coords is not None:
+            coords = tuple(coords)
+            if coords != last_coords:
+                self.canvas.coords(item, *coords)
+                last_coords = coords
+        changed = {k: v for k, v in options.items() if last_options.get(k) != v}
+        if changed:
+            self.canvas.itemconfigure(item, **changed)
+            last_options = {**last_options, **changed}
+        self.state[item] = (last_coords, last_options)
+
+    def scale(self, scale_x, scale_y):
+        """Stretch the whole scene about the origin, e.g. as a resize preview
+
+        Cached coordinates are dropped so the next update() places every
+        item exactly again.
+        """
+        self.canvas.scale(self.tag, 0, 0, scale_x, scale_y)
+        for item, (_, options) in self.state.items():
+            self.state[item] = (None, options)
+
+    def remove(self, role):
+        """Delete every item of `role`"""
+        self.items(role, 0, None)
+
+    def clear(self):
+        """Delete the whole scene"""
+        self.canvas.delete(self.tag)
+        self.pools.clear()
+        self.state.clear()
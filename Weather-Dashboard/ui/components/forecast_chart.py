@@ -2,7 +2,15 @@ import tkinter as tk
 from tkinter import ttk
 import time
 from utils.logger import logger
-from config.constants import TEMP_COLORS
+from utils.time_format import get_formatter
+from utils.units import METRIC
+from models.conditions import condition_emoji
+from .chart_hover import ChartHover
+from .chart_scene import ChartScene
+from .frame_clock import get_frame_clock
+from .gradients import temperature_color
+from .resize import ResizeCoalescer
+from .visibility import VisibilityMonitor
 from .weather_animations import WeatherAnimator
 
 
@@ -10,10 +18,30 @@ class ForecastChart(ttk.Frame):
     def __init__(self, parent):
         super().__init__(parent)
         self.setup_chart()
-        self.animation_speed = 20  # ms per frame
-        self.hover_point = None
+        self.animation_speed = 20  # ms between successive points starting
+        self.grow_duration = 120  # ms for a point to reach full size
+        self.point_radius = 4
+        self.animation_token = None  # frame clock registration
+        self.animation_paused_at = None  # perf_counter when hidden mid-entry
+        self.visible = True
+        self.animation_start = 0.0
+        self.animation_done = 0
+        self.point_items = []
+        self.icon_items = []
+        self.line_items = []
         self.points_data = []
+        self.series = None
+        self.temps = []
+        self.units = METRIC
+        self.icons = []
+        self.time_labels = []
+        self.scene = ChartScene(self.canvas)
         self.weather_animator = WeatherAnimator(self.canvas)
+        self.clock = get_frame_clock(self.canvas)
+        self.resizer = ResizeCoalescer(
+            self.canvas, self.on_canvas_resize, preview=self.preview_resize
+        )
+        self.visibility = VisibilityMonitor(self.canvas, self.set_visible)
 
     def setup_chart(self):
         """Setup the chart canvas and tooltip"""
@@ -23,232 +51,248 @@ class ForecastChart(ttk.Frame):
         )
         self.canvas.pack(fill=tk.BOTH, expand=True)
 
-        # Create tooltip
-        self.tooltip = ttk.Label(
-            self,
-            style="Tooltip.TLabel",
-            background="#1a1a1a",
-            foreground="white",
-            padding=5,
-        )
-
-        # Bind mouse events
-        self.canvas.bind("<Motion>", self.on_mouse_move)
-        self.canvas.bind("<Leave>", self.on_mouse_leave)
-
-    def animate_point(self, points, index=0):
-        """Animate points appearing one by one"""
-        if index >= len(points):
+        # Tooltip and highlight are canvas items reused across hovers
+        self.hover = ChartHover(self.canvas, self.describe_point)
+
+    def destroy(self):
+        self.cancel_animation()
+        self.weather_animator.stop_animation()
+        self.visibility.cancel()
+        self.resizer.cancel()
+        self.hover.cancel()
+        super().destroy()
+
+    def cancel_animation(self):
+        """Stop a running entry animation, leaving items where they are"""
+        if self.animation_token is not None:
+            self.clock.remove(self.animation_token)
+            self.animation_token = None
+        self.animation_paused_at = None
+
+    def set_visible(self, visible):
+        """Suspend animations and deferred relayouts while the chart is hidden
+
+        Nothing is torn down: on return the weather effect, the entry
+        animation and any pending relayout continue where they stopped.
+        """
+        self.visible = visible
+        if not visible:
+            self.weather_animator.pause()
+            self.resizer.pause()
+            self.hover.on_leave(None)
+            if self.animation_token is not None:
+                self.clock.remove(self.animation_token)
+                self.animation_token = None
+                self.animation_paused_at = time.perf_counter()
             return
 
-        x, y, temp, date, desc, details = points[index]
-
-        # Draw point with animation
-        radius = 4
-        color = self.get_temperature_color(temp)
-
-        # Animate point appearing
-        for r in range(radius + 1):
-            self.canvas.delete(f"point_{index}")
-            self.canvas.create_oval(
-                x - r,
-                y - r,
-                x + r,
-                y + r,
-                fill=color,
-                outline="white",
-                tags=(f"point_{index}", "point"),
-            )
-            self.update()
-            time.sleep(0.01)
-
-        # Draw weather icon
-        self.canvas.create_text(
-            x,
-            y - 15,
-            text=details["icon"],
-            font=("Segoe UI Emoji", 12),
-            fill="white",
-            tags=("icon",),
+        self.resizer.resume()
+        self.weather_animator.resume()
+        if self.animation_paused_at is not None:
+            # Shift the start so the entry animation skips the hidden time
+            self.animation_start += time.perf_counter() - self.animation_paused_at
+            self.animation_paused_at = None
+            self.animation_token = self.clock.add(self.animate_frame)
+
+    def start_point_animation(self):
+        """Lay out the point, icon and line items and start growing them
+
+        Items come from the retained scene, so a new forecast with the same
+        number of points reuses every item; frames only move them, so the
+        Tk event loop is free between frames.
+        """
+        self.cancel_animation()
+        scene = self.scene
+        count = len(self.points_data)
+        self.line_items = scene.items(
+            "line", max(count - 1, 0), "line", fill="white", width=2
         )
-
-        # Draw connecting line to previous point
-        if index > 0:
-            prev_x, prev_y = points[index - 1][:2]
-            self.canvas.create_line(
-                prev_x, prev_y, x, y, fill="white", width=2, smooth=True, tags=("line",)
+        self.point_items = scene.items("point", count, "oval", outline="white")
+        self.icon_items = scene.items(
+            "icon", count, "text", font=("Segoe UI Emoji", 12), fill="white"
+        )
+        self.canvas.tag_raise("point")
+        self.canvas.tag_raise("icon")
+
+        for n, (x, y, i) in enumerate(self.points_data):
+            color = temperature_color(self.units.celsius(self.temps[i]))
+            scene.update(self.point_items[n], (x, y, x, y), fill=color)
+            scene.update(
+                self.icon_items[n], (x, y - 15), text=self.icons[i], state="hidden"
             )
+            if n > 0:
+                prev_x, prev_y = self.points_data[n - 1][:2]
+                scene.update(self.line_items[n - 1], (prev_x, prev_y, prev_x, prev_y))
+
+        self.animation_start = time.perf_counter()
+        self.animation_done = 0  # points that reached full size
+        if not self.visible:
+            # Data arrived on another tab; play the entry when it is shown
+            self.animation_paused_at = self.animation_start
+        elif self.animate_frame():
+            self.animation_token = self.clock.add(self.animate_frame)
+
+    def animate_frame(self, dt=None):
+        """Advance the entry animation to the current elapsed time
+
+        Returns False once every point is fully drawn, which drops the
+        callback from the frame clock.
+        """
+        scene = self.scene
+        elapsed = (time.perf_counter() - self.animation_start) * 1000
+        stagger = self.animation_speed
+        grow = self.grow_duration
+        radius = self.point_radius
+        count = len(self.points_data)
+
+        n = self.animation_done
+        while n < count:
+            progress = (elapsed - n * stagger) / grow
+            if progress <= 0:
+                break  # later points have not started yet
+            progress = min(progress, 1.0)
+            x, y, _ = self.points_data[n]
+            r = radius * progress
+            scene.update(self.point_items[n], (x - r, y - r, x + r, y + r))
+            if n > 0:
+                prev_x, prev_y = self.points_data[n - 1][:2]
+                scene.update(
+                    self.line_items[n - 1],
+                    (
+                        prev_x,
+                        prev_y,
+                        prev_x + (x - prev_x) * progress,
+                        prev_y + (y - prev_y) * progress,
+                    ),
+                )
+            if progress < 1.0:
+                n += 1
+                continue
+            scene.update(self.icon_items[n], state="normal")
+            if n == self.animation_done:
+                self.animation_done += 1
+            n += 1
+
+        if self.animation_done < count:
+            return True
+        self.animation_token = None
+        return False
+
+    def update_chart(self, series):
+        """Update chart with a ForecastSeries
+
+        A series already converted to display units is drawn as is.
+        """
+        self.cancel_animation()
+        self.series = series
+        self.units = series.units or METRIC
+        self.temps = series.temperatures(self.units.temp_unit)
+        self.time_labels = series.labels("%Y-%m-%d %H:%M")
+        self.icons = [condition_emoji(c) for c in series.condition_id]
 
-        # Schedule next point
-        self.after(self.animation_speed, lambda: self.animate_point(points, index + 1))
+        # Start weather animation based on current weather
+        self.weather_animator.start_animation(series.condition_id[0])
 
-    def update_chart(self, forecast_data):
-        """Update chart with new forecast data"""
-        self.canvas.delete("all")
-        self.points_data = []
+        self.layout(self.canvas.winfo_width(), self.canvas.winfo_height())
 
-        # Start weather animation based on current weather
-        current_weather = forecast_data[0]["description"].lower()
-        self.weather_animator.start_animation(current_weather)
+        # Start animation
+        self.start_point_animation()
 
-        # Calculate dimensions
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
+    def layout(self, width, height):
+        """Compute point positions and lay out the axes for a canvas size"""
         padding = min(40, width * 0.1)
 
         # Process data
-        temps = [item["temp"] for item in forecast_data]
-        min_temp = min(temps)
-        max_temp = max(temps)
+        min_temp = min(self.temps)
+        max_temp = max(self.temps)
         temp_range = max(max_temp - min_temp, 1)
 
         # Draw axes and grid
         self.draw_axes(padding, width, height, min_temp, max_temp)
 
-        # Prepare points for animation
-        points = []
-        for i, item in enumerate(forecast_data):
-            x = padding + ((width - 2 * padding) * i / (len(forecast_data) - 1))
-            y = (
-                padding
-                + (height - 2 * padding)
-                - ((height - 2 * padding) * (item["temp"] - min_temp) / temp_range)
+        # Prepare points for animation; each point refers back to its index
+        plot_width = width - 2 * padding
+        plot_height = height - 2 * padding
+        # Placed by time: OneCall forecasts widen from 3-hourly to daily
+        fractions = self.series.time_fractions()
+        self.points_data = [
+            (
+                padding + plot_width * fractions[i],
+                padding + plot_height - plot_height * (temp - min_temp) / temp_range,
+                i,
             )
-
-            points.append(
-                (
-                    x,
-                    y,
-                    item["temp"],
-                    item["date"],
-                    item["description"],
-                    {
-                        "humidity": item["humidity"],
-                        "wind_speed": item["wind_speed"],
-                        "icon": item["icon"],
-                    },
-                )
+            for i, temp in enumerate(self.temps)
+        ]
+        self.hover.set_points(self.points_data)
+
+    def place_points(self, count):
+        """Put the first `count` points and their lines at full size"""
+        scene = self.scene
+        radius = self.point_radius
+        for n, (x, y, _) in enumerate(self.points_data[:count]):
+            scene.update(
+                self.point_items[n], (x - radius, y - radius, x + radius, y + radius)
             )
-            self.points_data.append((x, y, item))
-
-        # Start animation
-        self.animate_point(points)
-
-    def on_mouse_move(self, event):
-        """Handle mouse movement over chart"""
-        x, y = event.x, event.y
-
-        # Find closest point
-        closest_point = None
-        min_distance = float("inf")
-
-        for px, py, data in self.points_data:
-            distance = ((x - px) ** 2 + (y - py) ** 2) ** 0.5
-            if distance < min_distance and distance < 20:
-                min_distance = distance
-                closest_point = (px, py, data)
-
-        if closest_point:
-            self.show_tooltip(closest_point)
-            self.highlight_point(closest_point)
-        else:
-            self.hide_tooltip()
-            self.remove_highlight()
-
-    def show_tooltip(self, point_data):
-        """Show tooltip with point details"""
-        x, y, data = point_data
-        tooltip_text = (
-            f"Date: {data['date'].strftime('%Y-%m-%d %H:%M')}\n"
-            f"Temperature: {data['temp']:.1f}°C\n"
-            f"Humidity: {data['humidity']}%\n"
-            f"Wind: {data['wind_speed']} m/s\n"
-            f"Condition: {data['description']}"
+            scene.update(self.icon_items[n], (x, y - 15))
+            if n > 0:
+                prev_x, prev_y = self.points_data[n - 1][:2]
+                scene.update(self.line_items[n - 1], (prev_x, prev_y, x, y))
+
+    def preview_resize(self, scale_x, scale_y):
+        """Stretch the chart while a resize is in progress"""
+        self.hover.hide()
+        self.scene.scale(scale_x, scale_y)
+
+    def on_canvas_resize(self, width, height):
+        """Relayout once the canvas size has settled after a resize"""
+        self.weather_animator.resize(width, height)
+        if self.series is None:
+            return
+        self.layout(width, height)
+        # Finished points move now; running ones pick up the new layout
+        # on their next animation frame
+        self.place_points(self.animation_done)
+
+    def describe_point(self, i):
+        """Tooltip text for point i"""
+        series = self.series
+        return (
+            f"Date: {self.time_labels[i]}\n"
+            f"Temperature: {self.temps[i]:.1f}{self.units.temp_symbol}\n"
+            f"Humidity: {series.humidity[i]:.0f}%\n"
+            f"Wind: {series.wind_speed[i]:.1f} {self.units.speed_unit}\n"
+            f"Condition: {series.descriptions[i]}"
         )
 
-        self.tooltip.configure(text=tooltip_text)
-        self.tooltip.place(x=x + 10, y=y - 10)
-
-    def hide_tooltip(self):
-        """Hide the tooltip"""
-        self.tooltip.place_forget()
-
-    def highlight_point(self, point_data):
-        """Highlight the hovered point"""
-        if self.hover_point != point_data:
-            self.remove_highlight()
-            x, y, data = point_data
-            self.canvas.create_oval(
-                x - 6,
-                y - 6,
-                x + 6,
-                y + 6,
-                outline="white",
-                width=2,
-                tags=("highlight",),
-            )
-            self.hover_point = point_data
-
-    def remove_highlight(self):
-        """Remove point highlight"""
-        self.canvas.delete("highlight")
-        self.hover_point = None
-
-    def get_temperature_color(self, temp):
-        """Get color based on temperature"""
-        if temp <= 0:
-            return TEMP_COLORS["cold"]
-        elif temp <= 10:
-            return TEMP_COLORS["cool"]
-        elif temp <= 20:
-            return TEMP_COLORS["mild"]
-        elif temp <= 30:
-            return TEMP_COLORS["warm"]
-        else:
-            return TEMP_COLORS["hot"]
-
     def draw_axes(self, padding, width, height, min_temp, max_temp):
-        """Draw chart axes with grid and labels"""
-        # Draw main axes
-        self.canvas.create_line(
-            padding, padding, padding, height - padding, fill="white", width=1
-        )
-        self.canvas.create_line(
-            padding,
-            height - padding,
-            width - padding,
-            height - padding,
-            fill="white",
-            width=1,
+        """Lay out chart axes with grid and labels"""
+        scene = self.scene
+
+        # Main axes
+        y_axis, x_axis = scene.items("axis", 2, "line", fill="white", width=1)
+        scene.update(y_axis, (padding, padding, padding, height - padding))
+        scene.update(
+            x_axis, (padding, height - padding, width - padding, height - padding)
         )
 
-        # Draw temperature grid and labels
+        # Temperature grid and labels
+        grid_lines = scene.items("grid", 5, "line", fill="gray", dash=(2, 4))
+        grid_labels = scene.items("grid_label", 5, "text", fill="white", anchor="e")
         temp_step = (max_temp - min_temp) / 4
         for i in range(5):
             y = padding + (height - 2 * padding) * i / 4
             temp = max_temp - temp_step * i
-
-            # Draw horizontal grid line
-            self.canvas.create_line(
-                padding, y, width - padding, y, fill="gray", dash=(2, 4)
-            )
-
-            # Draw temperature label
-            self.canvas.create_text(
-                padding - 10, y, text=f"{temp:.1f}°", fill="white", anchor="e"
-            )
-
-        # Draw time labels
+            scene.update(grid_lines[i], (padding, y, width - padding, y))
+            scene.update(grid_labels[i], (padding - 10, y), text=f"{temp:.1f}°")
+
+        # Time labels: evenly spaced ticks over the forecast's time span,
+        # formatted in the city's UTC offset like the tooltips
+        timestamps = self.series.timestamps
+        start, span = timestamps[0], timestamps[-1] - timestamps[0]
+        ticks = [start + span * i // 6 for i in range(7)]
+        texts = get_formatter(self.series.utc_offset).format_many(ticks, "%a %H:%M")
+        time_labels = scene.items("time_label", 7, "text", fill="white", anchor="n")
         time_step = (width - 2 * padding) / 6
-        for i in range(7):
+        for i, label in enumerate(time_labels):
             x = padding + time_step * i
-            self.canvas.create_text(
-                x, height - padding + 15, text=f"Day {i+1}", fill="white", anchor="n"
-            )
-
-    def on_mouse_leave(self, event):
-        """Handle mouse leaving the chart area"""
-        # Clear any tooltips or highlights when mouse leaves the chart
-        if hasattr(self, "tooltip"):
-            self.tooltip.destroy()
-            delattr(self, "tooltip")
+            scene.update(label, (x, height - padding + 15), text=texts[i])
@@ -0,0 +1,116 @@
+import time
+from utils.logger import logger
+
+
+class FrameClock:
+    """One after() loop that drives every animation under a toplevel
+
+    Callbacks are called as callback(dt_ms) once per frame and are dropped
+    when they return False. The clock measures how long each frame's work
+    takes and adapts: over budget it first lowers `quality` (which
+    animations use to scale particle and ray counts), then stretches the
+    frame interval; with sustained headroom it undoes both.
+    """
+
+    def __init__(
+        self,
+        widget,
+        interval=33,
+        budget=0.5,
+        min_quality=0.25,
+        max_interval=100,
+        recover_frames=30,
+    ):
+        self.widget = widget
+        self.base_interval = interval
+        self.interval = interval
+        self.budget = budget  # share of the interval frame work may use
+        self.min_quality = min_quality
+        self.max_interval = max_interval
+        self.recover_frames = recover_frames
+        self.quality = 1.0
+        self.load = 0.0  # smoothed work time / interval
+        self.headroom = 0  # consecutive frames well under budget
+        self.callbacks = {}
+        self.next_token = 0
+        self.last_tick = None
+        self.job = None
+
+    def add(self, callback):
+        """Register a per-frame callback; returns a token for remove()"""
+        self.next_token += 1
+        self.callbacks[self.next_token] = callback
+        if self.job is None:
+            self.last_tick = None
+            self.job = self.widget.after(self.interval, self.tick)
+        return self.next_token
+
+    def remove(self, token):
+        self.callbacks.pop(token, None)
+        if not self.callbacks and self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+    def tick(self):
+        self.job = None
+        start = time.perf_counter()
+        dt = (start - self.last_tick) * 1000 if self.last_tick else self.interval
+        self.last_tick = start
+
+        for token, callback in list(self.callbacks.items()):
+            try:
+                keep = callback(dt)
+            except Exception as e:
+                logger.error(f"Animation callback failed: {str(e)}")
+                keep = False
+            if keep is False:
+                self.callbacks.pop(token, None)
+
+        self.adapt((time.perf_counter() - start) * 1000, dt)
+        if self.callbacks:
+            self.job = self.widget.after(self.interval, self.tick)
+
+    def adapt(self, work, dt):
+        """Trade quality and frame rate against measured frame cost"""
+        self.load = 0.8 * self.load + 0.2 * (work / self.interval)
+        # A late frame means input and redraws are already queueing up
+        late = dt > self.interval * 2
+
+        if self.load > self.budget or late:
+            self.headroom = 0
+            if self.quality > self.min_quality:
+                self.quality = max(self.min_quality, self.quality - 0.125)
+            elif self.interval < self.max_interval:
+                self.interval = min(self.max_interval, round(self.interval * 1.25))
+            else:
+                return
+            logger.debug(
+                f"Frame over budget, quality {self.quality:.2f} "
+                f"interval {self.interval}ms"
+            )
+        elif self.load < self.budget / 2:
+            self.headroom += 1
+            if self.headroom < self.recover_frames:
+                return
+            self.headroom = 0
+            if self.interval > self.base_interval:
+                self.interval = max(self.base_interval, round(self.interval / 1.25))
+            elif self.quality < 1.0:
+                self.quality = min(1.0, self.quality + 0.125)
+        else:
+            self.headroom = 0
+
+    def stop(self):
+        self.callbacks.clear()
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
+
+
+def get_frame_clock(widget):
+    """The shared FrameClock of a widget's toplevel window"""
+    toplevel = widget.winfo_toplevel()
+    clock = getattr(toplevel, "frame_clock", None)
+    if clock is None:
+        clock = toplevel.frame_clock = FrameClock(toplevel)
+    return clock
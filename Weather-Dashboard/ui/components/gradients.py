@@ -0,0 +1,99 @@
+import tkinter as tk
+from collections import OrderedDict
+from config.constants import TEMP_COLORS
+
+
+def _hex_to_rgb(color):
+    return tuple(int(color[i : i + 2], 16) for i in (1, 3, 5))
+
+
+class ColorRamp:
+    """Piecewise-linear color scale, precomputed into a lookup table
+
+    `stops` are (value, "#rrggbb") pairs in ascending value order; values
+    outside the stops clamp to the end colors.
+    """
+
+    def __init__(self, name, stops, resolution=0.1):
+        self.name = name
+        self.low = stops[0][0]
+        self.high = stops[-1][0]
+        self.resolution = resolution
+        steps = max(int(round((self.high - self.low) / resolution)), 1)
+        rgb_stops = [(value, _hex_to_rgb(color)) for value, color in stops]
+
+        self.table = []
+        segment = 0
+        for step in range(steps + 1):
+            value = self.low + step * resolution
+            while segment < len(rgb_stops) - 2 and value > rgb_stops[segment + 1][0]:
+                segment += 1
+            (v0, c0), (v1, c1) = rgb_stops[segment], rgb_stops[segment + 1]
+            t = min(max((value - v0) / (v1 - v0), 0.0), 1.0)
+            self.table.append(
+                "#%02x%02x%02x" % tuple(round(a + (b - a) * t) for a, b in zip(c0, c1))
+            )
+
+    def color(self, value):
+        """Color for a value, in constant time"""
+        index = int(round((value - self.low) / self.resolution))
+        return self.table[min(max(index, 0), len(self.table) - 1)]
+
+
+# Stops sit at the middle of the old 0/10/20/30 °C buckets
+TEMPERATURE_RAMP = ColorRamp(
+    "temperature",
+    [
+        (-5, TEMP_COLORS["cold"]),
+        (5, TEMP_COLORS["cool"]),
+        (15, TEMP_COLORS["mild"]),
+        (25, TEMP_COLORS["warm"]),
+        (35, TEMP_COLORS["hot"]),
+    ],
+)
+
+SKY_RAMP = ColorRamp("sky", [(0, "#87CEEB"), (0.5, "#B0E2FF"), (1, "#87CEEB")], 0.01)
+
+
+def temperature_color(celsius):
+    """Chart color for a temperature in Celsius"""
+    return TEMPERATURE_RAMP.color(celsius)
+
+
+class GradientCache:
+    """LRU cache of vertical gradient PhotoImages
+
+    Images are keyed by (palette, size, value range), so a redraw at an
+    unchanged size and range reuses the same image.
+    """
+
+    def __init__(self, max_images=16):
+        self.max_images = max_images
+        self.images = OrderedDict()
+
+    def vertical(self, master, ramp, width, height, top, bottom):
+        """Image of `ramp` running from value `top` down to `bottom`"""
+        width, height = max(int(width), 1), max(int(height), 1)
+        key = (ramp.name, width, height, round(top, 1), round(bottom, 1))
+        image = self.images.get(key)
+        if image is not None:
+            self.images.move_to_end(key)
+            return image
+
+        image = tk.PhotoImage(master=master, width=width, height=height)
+        # One put per run of identical rows
+        span = (bottom - top) / max(height - 1, 1)
+        run_start, run_color = 0, ramp.color(top)
+        for y in range(1, height + 1):
+            color = ramp.color(top + span * y) if y < height else None
+            if color != run_color:
+                image.put(run_color, to=(0, run_start, width, y))
+                run_start, run_color = y, color
+
+        self.images[key] = image
+        if len(self.images) > self.max_images:
+            self.images.popitem(last=False)
+        return image
+
+
+gradient_cache = GradientCache()
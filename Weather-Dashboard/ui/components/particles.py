@@ -0,0 +1,95 @@
+from array import array
+from random import random, randrange
+
+
+class ParticlePool:
+    """Fixed set of canvas particles that are recycled, never re-created
+
+    Positions live in parallel arrays. Every particle belongs to one
+    velocity lane, and each lane's items share a tag, so a frame is one
+    canvas.move per lane plus one move per particle that left the screen
+    and is sent back to the top. set_active() parks the tail of the pool
+    when the frame clock asks for fewer particles.
+    """
+
+    def __init__(self, canvas, tag, lanes, count):
+        self.canvas = canvas
+        self.tag = tag
+        self.lanes = lanes  # [(dx, dy), ...] per frame
+        self.count = count
+        self.items = []
+        self.xs = array("d")
+        self.ys = array("d")
+        self.lane_of = array("B")
+        self.active = 0  # leading items that are visible
+
+    def lane_tag(self, lane):
+        return f"{self.tag}_lane{lane}"
+
+    def fill(self, width, height, create):
+        """Create the pool's items, scattered above the top edge
+
+        `create(x, y, tags)` makes one canvas item and returns its id.
+        """
+        for i in range(self.count):
+            lane = i % len(self.lanes)
+            x = random() * width
+            y = -random() * height / 2
+            self.items.append(create(x, y, (self.tag, self.lane_tag(lane))))
+            self.xs.append(x)
+            self.ys.append(y)
+            self.lane_of.append(lane)
+        self.active = len(self.items)
+
+    def set_active(self, count):
+        """Show only the first `count` particles and park the rest
+
+        Parked particles are hidden and lose their lane tag, so frames
+        neither move nor recycle them; they resume from where they stopped.
+        """
+        count = max(0, min(count, len(self.items)))
+        if count == self.active:
+            return
+        canvas = self.canvas
+        if count > self.active:
+            for i in range(self.active, count):
+                item = self.items[i]
+                canvas.addtag_withtag(self.lane_tag(self.lane_of[i]), item)
+                canvas.itemconfigure(item, state="normal")
+        else:
+            for i in range(count, self.active):
+                item = self.items[i]
+                canvas.dtag(item, self.lane_tag(self.lane_of[i]))
+                canvas.itemconfigure(item, state="hidden")
+        self.active = count
+
+    def step(self, width, height, scale=1.0):
+        """Advance one frame and recycle particles that left the canvas
+
+        `scale` stretches the lane velocities for frames longer or shorter
+        than the one they were tuned for.
+        """
+        canvas = self.canvas
+        lanes = [(dx * scale, dy * scale) for dx, dy in self.lanes]
+        for lane, (dx, dy) in enumerate(lanes):
+            canvas.move(self.lane_tag(lane), dx, dy)
+
+        xs, ys, lane_of = self.xs, self.ys, self.lane_of
+        for i in range(self.active):
+            dx, dy = lanes[lane_of[i]]
+            x = xs[i] + dx
+            y = ys[i] + dy
+            if y > height or x < 0 or x > width:
+                # Back to the top at a fresh column
+                new_x = randrange(max(int(width), 1))
+                new_y = -random() * height / 4
+                canvas.move(self.items[i], new_x - x, new_y - y)
+                x, y = new_x, new_y
+            xs[i] = x
+            ys[i] = y
+
+    def clear(self):
+        self.canvas.delete(self.tag)
+        self.items.clear()
+        del self.xs[:], self.ys[:], self.lane_of[:]
+        self.active = 0
@@ -0,0 +1,60 @@
+class ResizeCoalescer:
+    """Collapse a burst of <Configure> events into one settled relayout
+
+    Every size change during a drag only calls `preview(scale_x, scale_y)`,
+    which should be cheap (e.g. canvas.scale on existing items). Once no
+    new size has arrived for `settle_delay` ms, `relayout(width, height)`
+    runs a single time with the final size. While paused, sizes are only
+    recorded and the relayout waits for resume().
+    """
+
+    def __init__(self, widget, relayout, preview=None, settle_delay=150):
+        self.widget = widget
+        self.relayout = relayout
+        self.preview = preview
+        self.settle_delay = settle_delay
+        self.size = None  # size of the last full layout
+        self.shown_size = None  # size the canvas content currently matches
+        self.job = None
+        self.paused = False
+        widget.bind("<Configure>", self.on_configure, add="+")
+
+    def on_configure(self, event):
+        if event.widget is not self.widget:
+            return
+        size = (event.width, event.height)
+        if size == self.shown_size:
+            return
+        if self.paused:
+            # Nothing is on screen to stretch; resume() relayouts once
+            self.shown_size = size
+            return
+
+        if self.preview is not None and self.shown_size is not None:
+            old_width, old_height = self.shown_size
+            if old_width > 1 and old_height > 1:
+                self.preview(event.width / old_width, event.height / old_height)
+        self.shown_size = size
+
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+        self.job = self.widget.after(self.settle_delay, self.settle)
+
+    def settle(self):
+        self.job = None
+        if self.shown_size != self.size:
+            self.size = self.shown_size
+            self.relayout(*self.size)
+
+    def pause(self):
+        self.paused = True
+        self.cancel()
+
+    def resume(self):
+        self.paused = False
+        self.settle()
+
+    def cancel(self):
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
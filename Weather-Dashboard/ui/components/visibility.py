@@ -0,0 +1,41 @@
+class VisibilityMonitor:
+    """Report when a widget becomes hidden or shown again
+
+    A widget counts as visible while it and every ancestor are mapped, so
+    switching notebook tabs and minimizing the window both hide it. Map,
+    Unmap, tab change and focus events on the toplevel only prompt a
+    re-check, coalesced into one after_idle call; an unfocused window that
+    is still on screen stays visible. `on_change(visible)` runs on changes.
+    """
+
+    EVENTS = ("<Map>", "<Unmap>", "<<NotebookTabChanged>>", "<FocusIn>", "<FocusOut>")
+
+    def __init__(self, widget, on_change):
+        self.widget = widget
+        self.on_change = on_change
+        self.visible = None
+        self.job = None
+        toplevel = widget.winfo_toplevel()
+        for sequence in self.EVENTS:
+            toplevel.bind(sequence, self.schedule_check, add="+")
+        self.schedule_check()
+
+    def schedule_check(self, event=None):
+        if self.job is None and self.on_change is not None:
+            self.job = self.widget.after_idle(self.check)
+
+    def check(self):
+        self.job = None
+        if self.on_change is None or not self.widget.winfo_exists():
+            return
+        visible = bool(self.widget.winfo_viewable())
+        if visible != self.visible:
+            self.visible = visible
+            self.on_change(visible)
+
+    def cancel(self):
+        """Stop reporting; toplevel bindings stay but become no-ops"""
+        self.on_change = None
+        if self.job is not None:
+            self.widget.after_cancel(self.job)
+            self.job = None
@@ -1,210 +1,253 @@
 import tkinter as tk
-from random import randint, choice
+from math import cos, radians, sin
+from random import randint, random
 import time
+from models.conditions import get_condition
+from .frame_clock import get_frame_clock
+from .gradients import SKY_RAMP, gradient_cache
+from .particles import ParticlePool
+
+# Stipple steps a lightning flash fades through, one per FLASH_STEP ms
+FLASH_STIPPLES = ("gray75", "gray50", "gray25")
+FLASH_STEP = 50
 
 
 class WeatherAnimator:
     def __init__(self, canvas):
         self.canvas = canvas
         self.animation_running = False
-        self.particles = []
-        self.animation_speed = 50  # ms between frames
-
-    def start_animation(self, weather_type):
-        """Start weather animation based on condition"""
+        self.particles = None  # ParticlePool of the running rain or snow
+        self.animation_speed = 50  # ms per frame that particle speeds assume
+        # Particle bounds; kept current by resize() rather than queried per frame
+        self.width = 1
+        self.height = 1
+        self.sky_image = None
+        # Every effect runs off the toplevel's shared clock; the token is
+        # dropped on stop so a restart never leaves an old loop behind
+        self.clock = get_frame_clock(canvas)
+        self.clock_token = None
+        self.paused = False  # set by pause() while the chart is hidden
+        self.effect = None  # per-frame step of the running animation
+        self.flash = None
+        self.flash_age = 0.0
+        self.rays = []
+        self.visible_rays = 0
+
+    def start_animation(self, condition_id):
+        """Start weather animation for an OWM condition id"""
         self.stop_animation()
         self.animation_running = True
-
-        if "rain" in weather_type:
-            self.animate_rain()
-        elif "snow" in weather_type:
-            self.animate_snow()
-        elif "thunder" in weather_type:
-            self.animate_thunder()
+        self.width = max(self.canvas.winfo_width(), 1)
+        self.height = max(self.canvas.winfo_height(), 1)
+
+        animation = get_condition(condition_id).animation
+        if animation == "rain":
+            self.start_rain()
+            self.effect = self.animate_rain
+        elif animation == "snow":
+            self.start_snow()
+            self.effect = self.animate_snow
+        elif animation == "thunder":
+            self.start_rain()
+            self.effect = self.animate_thunder
         else:
-            self.animate_clear_sky()
+            self.start_clear_sky()
+            self.effect = self.animate_clear_sky
 
-    def stop_animation(self):
-        """Stop current animation"""
-        self.animation_running = False
-        self.canvas.delete("weather_effect")
-        self.particles.clear()
+        if not self.paused:
+            self.clock_token = self.clock.add(self.frame)
 
-    def animate_rain(self):
-        """Animate rainfall"""
+    def frame(self, dt):
+        """Clock callback; scales motion to the frame's real duration"""
+        if not self.animation_running:
+            return False
+        self.effect(dt / self.animation_speed)
+        return True
+
+    def pause(self):
+        """Stop ticking while hidden, keeping every item where it is"""
+        self.paused = True
+        if self.clock_token is not None:
+            self.clock.remove(self.clock_token)
+            self.clock_token = None
+
+    def resume(self):
+        """Continue a paused effect from its current state"""
+        self.paused = False
+        if self.animation_running and self.clock_token is None:
+            self.clock_token = self.clock.add(self.frame)
+
+    def resize(self, width, height):
+        """Adopt new canvas bounds without rebuilding the running effect"""
+        self.width = max(width, 1)
+        self.height = max(height, 1)
         if not self.animation_running:
             return
 
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-
-        # Create new raindrops
-        while len(self.particles) < 100:
-            x = randint(0, width)
-            y = randint(-height // 2, 0)
-            speed = randint(10, 15)
-            self.particles.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "speed": speed,
-                    "id": self.canvas.create_line(
-                        x, y, x, y + 10, fill="#89CFF0", width=1, tags="weather_effect"
-                    ),
-                }
+        # Backdrop swaps to the cached image for the new size; particles
+        # keep falling and are recycled inside the new bounds
+        if self.canvas.find_withtag("sky_gradient"):
+            self.sky_image = gradient_cache.vertical(
+                self.canvas, SKY_RAMP, self.width, self.height, 0, 1
             )
+            self.canvas.itemconfigure("sky_gradient", image=self.sky_image)
 
-        # Update raindrop positions
-        for drop in self.particles[:]:
-            drop["y"] += drop["speed"]
-            self.canvas.coords(
-                drop["id"], drop["x"], drop["y"], drop["x"], drop["y"] + 10
-            )
-
-            # Remove drops that are off screen
-            if drop["y"] > height:
-                self.canvas.delete(drop["id"])
-                self.particles.remove(drop)
-
-        self.canvas.after(self.animation_speed, self.animate_rain)
-
-    def animate_snow(self):
-        """Animate snowfall"""
-        if not self.animation_running:
-            return
+    def stop_animation(self):
+        """Stop current animation"""
+        self.animation_running = False
+        if self.clock_token is not None:
+            self.clock.remove(self.clock_token)
+            self.clock_token = None
+        self.effect = None
+        self.canvas.delete("weather_effect")
+        self.particles = None
+        self.flash = None
+        self.rays = []
+        self.visible_rays = 0
+
+    def start_rain(self):
+        """Create the rain drop pool"""
+        self.particles = ParticlePool(
+            self.canvas,
+            "rain_drop",
+            [(0, speed) for speed in range(10, 16)],
+            count=100,
+        )
+        self.particles.fill(
+            self.width,
+            self.height,
+            lambda x, y, tags: self.canvas.create_line(
+                x,
+                y,
+                x,
+                y + 10,
+                fill="#89CFF0",
+                width=1,
+                tags=tags + ("weather_effect",),
+            ),
+        )
 
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-
-        # Create new snowflakes
-        while len(self.particles) < 50:
-            x = randint(0, width)
-            y = randint(-height // 2, 0)
-            size = randint(3, 6)
-            drift = choice([-1, 1])
-            speed = randint(2, 4)
-            self.particles.append(
-                {
-                    "x": x,
-                    "y": y,
-                    "size": size,
-                    "drift": drift,
-                    "speed": speed,
-                    "id": self.canvas.create_text(
-                        x,
-                        y,
-                        text="❄",
-                        fill="white",
-                        font=("Segoe UI Emoji", size),
-                        tags="weather_effect",
-                    ),
-                }
-            )
+    def start_snow(self):
+        """Create the snow flake pool"""
+        self.particles = ParticlePool(
+            self.canvas,
+            "snow_flake",
+            [(drift * 0.5, speed) for speed in (2, 3, 4) for drift in (-1, 1)],
+            count=50,
+        )
+        self.particles.fill(
+            self.width,
+            self.height,
+            lambda x, y, tags: self.canvas.create_text(
+                x,
+                y,
+                text="❄",
+                fill="white",
+                font=("Segoe UI Emoji", randint(3, 6)),
+                tags=tags + ("weather_effect",),
+            ),
+        )
 
-        # Update snowflake positions
-        for flake in self.particles[:]:
-            flake["y"] += flake["speed"]
-            flake["x"] += flake["drift"] * 0.5
-            self.canvas.coords(flake["id"], flake["x"], flake["y"])
+    def animate_particles(self, scale):
+        """Advance the particle pool, sized to the clock's quality"""
+        pool = self.particles
+        pool.set_active(round(pool.count * self.clock.quality))
+        pool.step(self.width, self.height, scale)
 
-            # Remove flakes that are off screen
-            if flake["y"] > height or flake["x"] < 0 or flake["x"] > width:
-                self.canvas.delete(flake["id"])
-                self.particles.remove(flake)
+    def animate_rain(self, scale):
+        """Animate rainfall"""
+        self.animate_particles(scale)
 
-        self.canvas.after(self.animation_speed, self.animate_snow)
+    def animate_snow(self, scale):
+        """Animate snowfall"""
+        self.animate_particles(scale)
 
-    def animate_thunder(self):
+    def animate_thunder(self, scale):
         """Animate thunderstorm"""
-        if not self.animation_running:
-            return
-
-        # Start with rain animation
-        self.animate_rain()
+        self.animate_particles(scale)
 
-        # Add occasional lightning flash
-        if randint(1, 50) == 1:  # 2% chance per frame
+        # Occasional lightning flash, 2% chance per reference frame
+        if self.flash is not None:
+            self.fade_flash(scale * self.animation_speed)
+        elif random() < 0.02 * scale:
             self.flash_lightning()
 
     def flash_lightning(self):
         """Create lightning flash effect"""
-        if not self.animation_running:
-            return
-
-        # Create flash overlay
-        flash = self.canvas.create_rectangle(
+        self.flash = self.canvas.create_rectangle(
             0,
             0,
-            self.canvas.winfo_width(),
-            self.canvas.winfo_height(),
+            self.width,
+            self.height,
             fill="white",
-            stipple="gray50",
+            stipple=FLASH_STIPPLES[0],
             tags=("weather_effect", "lightning"),
         )
+        self.flash_age = 0.0
+
+    def fade_flash(self, dt):
+        """Step the flash through its stipples, then remove it"""
+        self.flash_age += dt
+        step = int(self.flash_age // FLASH_STEP)
+        if step < len(FLASH_STIPPLES):
+            self.canvas.itemconfig(self.flash, stipple=FLASH_STIPPLES[step])
+        else:
+            self.canvas.delete(self.flash)
+            self.flash = None
+
+    def start_clear_sky(self):
+        """Lay down the sky gradient and the sun ray items"""
+        # Subtle sky gradient from a cached image, kept beneath the chart
+        self.sky_image = gradient_cache.vertical(
+            self.canvas, SKY_RAMP, self.width, self.height, 0, 1
+        )
+        self.canvas.create_image(
+            0,
+            0,
+            image=self.sky_image,
+            anchor="nw",
+            tags=("weather_effect", "sky_gradient"),
+        )
+        self.canvas.tag_lower("sky_gradient")
 
-        # Fade out flash
-        def fade_flash(opacity):
-            if opacity > 0 and self.animation_running:
-                self.canvas.itemconfig(flash, stipple=f"gray{opacity}")
-                self.canvas.after(50, lambda: fade_flash(opacity - 25))
-            else:
-                self.canvas.delete(flash)
-
-        fade_flash(75)
-
-    def animate_clear_sky(self):
-        """Animate clear sky with subtle sun rays"""
-        if not self.animation_running:
-            return
-
-        width = self.canvas.winfo_width()
-        height = self.canvas.winfo_height()
-
-        # Create subtle gradient background
-        self.canvas.delete("sky_gradient")
-        colors = ["#87CEEB", "#B0E2FF", "#87CEEB"]  # Sky blue shades
-        segments = len(colors) - 1
-
-        for i in range(segments):
-            y1 = height * i / segments
-            y2 = height * (i + 1) / segments
-            self.canvas.create_rectangle(
+        # Rays are created once and only moved; quality hides some of them
+        self.rays = [
+            self.canvas.create_line(
                 0,
-                y1,
-                width,
-                y2,
-                fill=colors[i],
-                outline=colors[i + 1],
-                tags=("weather_effect", "sky_gradient"),
+                0,
+                0,
+                0,
+                fill="#FFD700",
+                width=2,
+                stipple="gray75",
+                state="hidden",
+                tags=("weather_effect", "sun_rays"),
             )
+            for _ in range(8)
+        ]
+        self.visible_rays = 0
 
-        # Animate subtle sun rays
-        def animate_rays():
-            if not self.animation_running:
-                return
-
-            angle = time.time() * 30  # Rotate 30 degrees per second
-            ray_length = min(width, height) * 0.4
-
-            self.canvas.delete("sun_rays")
-
-            # Draw rotating rays
-            for i in range(8):
-                ray_angle = angle + (i * 45)
-                end_x = width / 2 + ray_length * cos(ray_angle)
-                end_y = height / 3 + ray_length * sin(ray_angle)
-
-                self.canvas.create_line(
-                    width / 2,
-                    height / 3,
-                    end_x,
-                    end_y,
-                    fill="#FFD700",
-                    width=2,
-                    stipple="gray75",
-                    tags=("weather_effect", "sun_rays"),
+    def animate_clear_sky(self, scale):
+        """Animate clear sky with subtle sun rays"""
+        count = max(2, round(len(self.rays) * self.clock.quality))
+        if count != self.visible_rays:
+            for n, ray in enumerate(self.rays):
+                self.canvas.itemconfigure(
+                    ray, state="normal" if n < count else "hidden"
                 )
+            self.visible_rays = count
 
-            self.canvas.after(50, animate_rays)
+        center_x = self.width / 2
+        center_y = self.height / 3
+        angle = time.time() * 30  # Rotate 30 degrees per second
+        ray_length = min(self.width, self.height) * 0.4
 
-        animate_rays()
+        for n in range(count):
+            ray_angle = radians(angle + n * 360 / count)
+            self.canvas.coords(
+                self.rays[n],
+                center_x,
+                center_y,
+                center_x + ray_length * cos(ray_angle),
+                center_y + ray_length * sin(ray_angle),
+            )
@@ -0,0 +1,53 @@
+import asyncio
+import threading
+
+
+class TkAsyncBridge:
+    """Run coroutines on a background event loop and deliver results to Tk.
+
+    Tk is not thread-safe, so results are never pushed from the loop thread.
+    The Tk side polls the pending future with `after()` and invokes the
+    callbacks from within mainloop once it completes.
+    """
+
+    def __init__(self, root, poll_interval=20):
+        self.root = root
+        self.poll_interval = poll_interval  # ms between completion checks
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro, on_success, on_error=None, on_done=None):
+        """Schedule a coroutine and call back on the Tk thread when it finishes"""
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        self.root.after(
+            self.poll_interval, self._poll, future, on_success, on_error, on_done
+        )
+        return future
+
+    def _poll(self, future, on_success, on_error, on_done):
+        if not future.done():
+            self.root.after(
+                self.poll_interval, self._poll, future, on_success, on_error, on_done
+            )
+            return
+
+        try:
+            if future.cancelled():
+                return
+            error = future.exception()
+            if error is None:
+                on_success(future.result())
+            elif on_error:
+                on_error(error)
+        finally:
+            if on_done:
+                on_done()
+
+    def shutdown(self):
+        """Stop the background event loop"""
+        self.loop.call_soon_threadsafe(self.loop.stop)
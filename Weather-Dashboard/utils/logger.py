@@ -5,6 +5,11 @@ import os
 
 def setup_logging():
     """Configure logging with rotation and formatting"""
+    logger = logging.getLogger("WeatherDashboard")
+    if logger.handlers:
+        # Already configured, e.g. by weather-dashboard.py
+        return logger
+
     log_directory = "logs"
     if not os.path.exists(log_directory):
         os.makedirs(log_directory)
@@ -24,7 +29,6 @@ def setup_logging():
     file_handler.setFormatter(log_format)
     console_handler.setFormatter(log_format)
 
-    logger = logging.getLogger("WeatherDashboard")
     logger.setLevel(logging.INFO)
     logger.addHandler(file_handler)
     logger.addHandler(console_handler)
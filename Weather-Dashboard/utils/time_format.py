@@ -0,0 +1,56 @@
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+
+@lru_cache(maxsize=64)
+def offset_zone(utc_offset):
+    """Shared datetime.timezone for an OWM UTC offset in seconds"""
+    if not utc_offset:
+        return timezone.utc
+    return timezone(timedelta(seconds=utc_offset))
+
+
+class TimeFormatter:
+    """Formats Unix timestamps in one fixed UTC offset"""
+
+    __slots__ = ("tz",)
+
+    def __init__(self, tz):
+        self.tz = tz
+
+    def datetime(self, timestamp):
+        return datetime.fromtimestamp(timestamp, self.tz)
+
+    def datetimes(self, timestamps):
+        """Aware datetimes for a batch of timestamps"""
+        tz = self.tz
+        return [datetime.fromtimestamp(ts, tz) for ts in timestamps]
+
+    def format(self, timestamp, fmt="%H:%M:%S %Z", missing="N/A"):
+        if timestamp is None:
+            return missing
+        return datetime.fromtimestamp(timestamp, self.tz).strftime(fmt)
+
+    def format_many(self, timestamps, fmt="%H:%M", missing="N/A"):
+        """Format a batch of timestamps with one zone lookup"""
+        tz = self.tz
+        return [
+            missing if ts is None else datetime.fromtimestamp(ts, tz).strftime(fmt)
+            for ts in timestamps
+        ]
+
+
+@lru_cache(maxsize=64)
+def _offset_formatter(utc_offset):
+    return TimeFormatter(offset_zone(utc_offset))
+
+
+def get_formatter(utc_offset=None):
+    """TimeFormatter for a city's UTC offset in seconds
+
+    None means the machine's own zone, which is looked up on every call
+    since it can change with daylight saving time.
+    """
+    if utc_offset is None:
+        return TimeFormatter(datetime.now().astimezone().tzinfo)
+    return _offset_formatter(int(utc_offset))
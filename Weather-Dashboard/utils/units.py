@@ -0,0 +1,117 @@
+from array import array
+from dataclasses import replace
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; plain arrays work everywhere
+    np = None
+
+# Every temperature scale is a linear function of Kelvin: value = K * a + b
+TEMPERATURE_SCALES = {"K": (1.0, 0.0), "C": (1.0, -273.15), "F": (1.8, -459.67)}
+TEMPERATURE_NAMES = {"K": "kelvin", "C": "degrees Celsius", "F": "degrees Fahrenheit"}
+MPH_PER_MPS = 2.2369362920544
+
+
+def temperature_transform(to_unit, from_unit="K"):
+    """Return (scale, offset) converting `from_unit` values to `to_unit`"""
+    from_scale, from_offset = TEMPERATURE_SCALES[from_unit]
+    to_scale, to_offset = TEMPERATURE_SCALES[to_unit]
+    scale = to_scale / from_scale
+    return scale, to_offset - from_offset * scale
+
+
+def scale_column(values, scale, offset=0.0):
+    """Apply value * scale + offset to a whole float array at once"""
+    if np is not None and len(values):
+        scaled = np.frombuffer(values, dtype=np.float64) * scale + offset
+        return array("d", scaled.tobytes())
+    return array("d", [v * scale + offset for v in values])
+
+
+def convert_temperatures(values, to_unit, from_unit="K"):
+    """Convert an array of temperatures between 'K', 'C' and 'F'"""
+    if to_unit == from_unit:
+        return array("d", values)
+    return scale_column(values, *temperature_transform(to_unit, from_unit))
+
+
+class UnitSystem:
+    """Display units for one `units` preference value"""
+
+    __slots__ = (
+        "name",
+        "temp_unit",
+        "temp_symbol",
+        "temp_name",
+        "speed_unit",
+        "speed_scale",
+    )
+
+    def __init__(self, name, temp_unit, speed_unit, speed_scale):
+        self.name = name
+        self.temp_unit = temp_unit
+        self.temp_symbol = "K" if temp_unit == "K" else f"°{temp_unit}"
+        self.temp_name = TEMPERATURE_NAMES[temp_unit]
+        self.speed_unit = speed_unit
+        self.speed_scale = speed_scale
+
+    def __repr__(self):
+        return f"UnitSystem({self.name!r})"
+
+    def temperature(self, kelvin):
+        """Convert one Kelvin value"""
+        scale, offset = temperature_transform(self.temp_unit)
+        return kelvin * scale + offset
+
+    def temperatures(self, kelvin_values):
+        """Convert a whole array of Kelvin values"""
+        return convert_temperatures(kelvin_values, self.temp_unit)
+
+    def celsius(self, value):
+        """Convert a value in this system back to Celsius, e.g. for color scales"""
+        scale, offset = temperature_transform("C", self.temp_unit)
+        return value * scale + offset
+
+    def speed(self, mps):
+        """Convert one wind speed from m/s"""
+        return mps * self.speed_scale
+
+    def convert_current(self, weather):
+        """Return a copy of CurrentConditions with temperatures and wind converted"""
+        scale, offset = temperature_transform(self.temp_unit)
+        return replace(
+            weather,
+            temp=weather.temp * scale + offset,
+            feels_like=weather.feels_like * scale + offset,
+            temp_min=weather.temp_min * scale + offset,
+            temp_max=weather.temp_max * scale + offset,
+            wind_speed=weather.wind_speed * self.speed_scale,
+            wind_gust=(
+                weather.wind_gust * self.speed_scale
+                if weather.wind_gust is not None
+                else None
+            ),
+        )
+
+
+METRIC = UnitSystem("metric", "C", "m/s", 1.0)
+IMPERIAL = UnitSystem("imperial", "F", "mph", MPH_PER_MPS)
+STANDARD = UnitSystem("standard", "K", "m/s", 1.0)
+
+UNIT_SYSTEMS = {
+    "metric": METRIC,
+    "imperial": IMPERIAL,
+    "standard": STANDARD,
+    # Spellings used by the CLI and the UI preferences model
+    "c": METRIC,
+    "celsius": METRIC,
+    "f": IMPERIAL,
+    "fahrenheit": IMPERIAL,
+    "k": STANDARD,
+    "kelvin": STANDARD,
+}
+
+
+def get_unit_system(name):
+    """Look up a UnitSystem by preference value, defaulting to metric"""
+    return UNIT_SYSTEMS.get(str(name).strip().lower(), METRIC)
@@ -2,6 +2,7 @@ import speech_recognition as sr
 import pyttsx3
 import threading
 from utils.logger import logger
+from utils.units import METRIC
 
 
 class WeatherVoiceAssistant:
@@ -90,17 +91,13 @@ class WeatherVoiceAssistant:
         except Exception as e:
             logger.error(f"Error in text-to-speech: {str(e)}")
 
-    def speak_weather(self, weather_data):
-        """Speak current weather conditions"""
+    def speak_weather(self, weather, units=METRIC):
+        """Speak current weather conditions from a converted CurrentConditions"""
         try:
-            temp = weather_data["main"]["temp"]
-            desc = weather_data["weather"][0]["description"]
-            humidity = weather_data["main"]["humidity"]
-
             text = (
-                f"The current temperature is {temp:.1f} degrees Celsius. "
-                f"Weather conditions are {desc}. "
-                f"Humidity is {humidity} percent."
+                f"The current temperature is {weather.temp:.1f} {units.temp_name}. "
+                f"Weather conditions are {weather.description}. "
+                f"Humidity is {weather.humidity} percent."
             )
 
             self.speak(text)
@@ -108,16 +105,16 @@ class WeatherVoiceAssistant:
             logger.error(f"Error speaking weather: {str(e)}")
             self.speak("I'm having trouble reading the weather data")
 
-    def speak_forecast(self, forecast_data):
+    def speak_forecast(self, forecast_data, units=METRIC):
         """Speak weather forecast"""
         try:
             today = forecast_data["list"][0]
-            temp = today["main"]["temp"]
+            temp = units.temperature(today["main"]["temp"])
             desc = today["weather"][0]["description"]
 
             text = (
                 f"The forecast shows {desc} with a temperature "
-                f"of {temp:.1f} degrees Celsius."
+                f"of {temp:.1f} {units.temp_name}."
             )
 
             self.speak(text)
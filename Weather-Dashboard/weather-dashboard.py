@@ -1,17 +1,14 @@
-import datetime as dt
 import requests
 import sys
 import json
+import queue
 from colorama import init, Fore, Style
 from difflib import get_close_matches
-from functools import lru_cache
-import time
 from datetime import datetime
-import pytz
 from zoneinfo import ZoneInfo
 import tkinter as tk
 from tkinter import ttk, messagebox
-import threading
+import asyncio
 import os
 import logging
 from logging.handlers import RotatingFileHandler
@@ -19,11 +16,43 @@ from datetime import timedelta
 import sqlite3
 from geopy.geocoders import Nominatim
 from geopy.distance import geodesic
+from utils.async_bridge import TkAsyncBridge
+from services.cache import WeatherCache, normalize_location
+from services.disk_cache import (
+    DiskCache,
+    NOT_MODIFIED,
+    conditional_headers,
+    response_validators,
+)
+from services.single_flight import SingleFlight
+from services.transport import ResilientSession, CircuitOpenError
+from services.quota import QuotaGovernor, QuotaExceededError
+from services.weather_service import WeatherService, is_transient_error
+from models.forecast_series import ForecastSeries
+from models.weather import decode_current
+from models.conditions import condition_emoji
+from ui.components.chart_hover import ChartHover
+from ui.components.chart_scene import ChartScene
+from ui.components.gradients import (
+    TEMPERATURE_RAMP,
+    gradient_cache,
+    temperature_color,
+)
+from ui.components.resize import ResizeCoalescer
+from ui.components.visibility import VisibilityMonitor
+from utils.units import get_unit_system
+from utils.time_format import get_formatter
+from config.constants import BASE_URL, FORECAST_URL, GEOCODING_URL
 
 
 # Setup logging configuration
 def setup_logging():
     """Configure logging with rotation and formatting"""
+    logger = logging.getLogger("WeatherDashboard")
+    if logger.handlers:
+        # Already configured, e.g. by utils.logger
+        return logger
+
     log_directory = "logs"
     if not os.path.exists(log_directory):
         os.makedirs(log_directory)
@@ -47,8 +76,6 @@ def setup_logging():
     file_handler.setFormatter(log_format)
     console_handler.setFormatter(log_format)
 
-    # Get the logger
-    logger = logging.getLogger("WeatherDashboard")
     logger.setLevel(logging.INFO)
 
     # Add handlers to logger
@@ -64,67 +91,6 @@ logger = setup_logging()
 # Initialize colorama
 init()
 
-# Weather emoji mappings
-WEATHER_EMOJIS = {
-    # Clear conditions
-    "clear sky": "☀️",
-    "sunny": "☀️",
-    # Cloudy conditions
-    "few clouds": "🌤️",
-    "scattered clouds": "⛅",
-    "broken clouds": "☁️",
-    "overcast clouds": "☁️",
-    "cloudy": "☁️",
-    # Rain conditions
-    "light rain": "🌦️",
-    "moderate rain": "🌧️",
-    "heavy rain": "🌧️",
-    "shower rain": "🌧️",
-    "rain": "🌧️",
-    "drizzle": "🌧️",
-    "light intensity drizzle": "🌧️",
-    "heavy intensity drizzle": "🌧️",
-    "light intensity shower rain": "🌧️",
-    "heavy intensity shower rain": "🌧️",
-    "very heavy rain": "🌧️",
-    "extreme rain": "🌧️",
-    # Thunderstorm conditions
-    "thunderstorm": "⛈️",
-    "light thunderstorm": "⛈️",
-    "heavy thunderstorm": "⛈️",
-    "thunderstorm with light rain": "⛈️",
-    "thunderstorm with rain": "⛈️",
-    "thunderstorm with heavy rain": "⛈️",
-    # Snow conditions
-    "snow": "🌨️",
-    "light snow": "🌨️",
-    "heavy snow": "🌨️",
-    "sleet": "🌨️",
-    "light shower sleet": "🌨️",
-    "shower sleet": "🌨️",
-    "light rain and snow": "🌨️",
-    "rain and snow": "🌨️",
-    # Atmospheric conditions
-    "mist": "🌫️",
-    "smoke": "🌫️",
-    "haze": "🌫️",
-    "fog": "🌫️",
-    "sand": "🌫️",
-    "dust": "🌫️",
-    "volcanic ash": "🌫️",
-    "squalls": "💨",
-    "tornado": "🌪️",
-    # Additional conditions
-    "light intensity drizzle rain": "🌧️",
-    "heavy intensity drizzle rain": "🌧️",
-    "shower rain and drizzle": "🌧️",
-    "heavy shower rain and drizzle": "🌧️",
-    "shower drizzle": "🌧️",
-}
-
-BASE_URL = "http://api.openweathermap.org/data/2.5/weather?"
-GEOCODING_URL = "http://ip-api.com/json/"  # Free geolocation API
-FORECAST_URL = "http://api.openweathermap.org/data/2.5/forecast?"
 
 try:
     Api_Key = open("api_key.txt", "rt").read().strip()
@@ -135,28 +101,112 @@ except Exception as e:
     print(f"{Fore.RED}Error reading API key: {e}{Style.RESET_ALL}")
     sys.exit(1)
 
-# Create a session for better performance
-session = requests.Session()
+# Shared session with pooled connections, timeouts, retries, a circuit breaker
+# and API quota pacing
+session = ResilientSession(governor=QuotaGovernor())
+
+
+# Cache for weather responses with per-endpoint TTLs
+weather_cache = WeatherCache()
+
+# Persistent response cache so restarts and offline periods are served locally
+disk_cache = DiskCache()
+
+# Concurrent requests for the same city share one API call
+inflight = SingleFlight()
+
+# Service used for the single-request OneCall fetch mode
+weather_service = WeatherService(Api_Key, session=session, disk_cache=disk_cache)
 
 
-# Cache for storing weather data (TTL: 10 minutes)
-@lru_cache(maxsize=32)
-def get_cached_weather(location, timestamp):
-    """Get weather data with caching. Timestamp ensures cache invalidation."""
-    return fetch_weather_data(location)
+class TransientFetchError(Exception):
+    """User-facing fetch error for failures worth riding out with cached data"""
 
 
-def get_cache_timestamp():
-    """Return current timestamp rounded to nearest 10 minutes for cache control"""
-    return int(time.time() / 600) * 600
+def is_transient_fetch_error(error):
+    """True for network, 5xx and quota failures; not for 401, 404 or 429"""
+    return isinstance(error, TransientFetchError) or is_transient_error(error)
+
+
+def display_key(payload):
+    """Place and timestamps of a /weather or /forecast payload
+
+    Enough to tell whether a payload differs from the one on screen without
+    keeping the payload itself alive.
+    """
+    if "list" in payload:
+        city = payload.get("city", {})
+        coord = city.get("coord", {})
+        items = payload["list"]
+        times = (items[0]["dt"], items[-1]["dt"]) if items else ()
+        return (city.get("id"), coord.get("lat"), coord.get("lon"), len(items), times)
+    coord = payload.get("coord", {})
+    return (payload.get("id"), coord.get("lat"), coord.get("lon"), payload.get("dt"))
+
+
+def get_cached_weather(location, on_refresh=None):
+    """Get current weather data, served from cache while fresh
+
+    `on_refresh(value)` runs on a worker thread if a stale value was served
+    and its background refresh succeeds.
+    """
+    return weather_cache.get(
+        "current",
+        normalize_location(location),
+        lambda: fetch_weather_data(location),
+        on_refresh,
+    )
+
+
+def get_cached_forecast(location, on_refresh=None):
+    """Get forecast data, served from cache while fresh"""
+    return weather_cache.get(
+        "forecast",
+        normalize_location(location),
+        lambda: fetch_forecast_data(location),
+        on_refresh,
+    )
+
+
+def get_cached_consolidated(location, on_refresh=None):
+    """Get current, forecast and UV data from one OneCall request"""
+    return weather_cache.get(
+        "onecall",
+        normalize_location(location),
+        lambda: weather_service.get_consolidated(location),
+        on_refresh,
+    )
 
 
 def fetch_weather_data(location):
-    """Fetch weather data from API with proper error handling and logging"""
+    """Fetch weather data, reading through the on-disk cache"""
+    key = normalize_location(location)
+    return inflight.do(
+        ("current", key),
+        lambda: disk_cache.read_through(
+            "current",
+            key,
+            lambda validators: request_weather_data(location, validators),
+            is_transient=is_transient_fetch_error,
+        ),
+    )
+
+
+def request_weather_data(location, validators=None):
+    """Fetch weather data from API with proper error handling and logging
+
+    Returns (data, validators), or NOT_MODIFIED when the server confirms the
+    cached copy described by `validators` is still current.
+    """
     try:
         logger.info(f"Fetching weather data for location: {location}")
         params = {"appid": Api_Key, "q": location}
-        response = session.get(BASE_URL, params=params)
+        response = session.get(
+            BASE_URL, params=params, headers=conditional_headers(validators or {})
+        )
+
+        if response.status_code == 304:
+            return NOT_MODIFIED
 
         if response.status_code != 200:
             logger.error(f"API request failed with status code {response.status_code}")
@@ -173,23 +223,31 @@ def fetch_weather_data(location):
             raise Exception("API rate limit exceeded. Please try again later.")
         elif response.status_code >= 500:
             logger.error(f"Server error: {response.status_code}")
-            raise Exception(
+            raise TransientFetchError(
                 "Weather service is currently unavailable. Please try again later."
             )
 
         response.raise_for_status()
         weather_data = response.json()
         logger.info("Weather data successfully retrieved")
-        return weather_data
-
+        return weather_data, response_validators(response)
+
+    except QuotaExceededError as e:
+        logger.warning(f"Request deferred by quota governor: {str(e)}")
+        raise TransientFetchError("API rate limit reached. Please try again later.")
+    except CircuitOpenError as e:
+        logger.warning(str(e))
+        raise TransientFetchError(
+            "Weather service is currently unavailable. Please try again later."
+        )
     except requests.exceptions.ConnectionError as e:
         logger.error(f"Connection error: {str(e)}")
-        raise Exception(
+        raise TransientFetchError(
             "Unable to connect to weather service. Please check your internet connection."
         )
     except requests.exceptions.Timeout as e:
         logger.error(f"Request timeout: {str(e)}")
-        raise Exception("Request timed out. Please try again.")
+        raise TransientFetchError("Request timed out. Please try again.")
     except requests.exceptions.RequestException as e:
         logger.error(f"Request error: {str(e)}")
         raise Exception(f"Error accessing weather service: {str(e)}")
@@ -250,55 +308,13 @@ def get_user_preferences():
     return location, unit_choice
 
 
-def kelvin_to_preferred_unit(kelvin, unit="C"):
-    """Convert Kelvin to preferred temperature unit"""
-    celsius = kelvin - 273.15
-    if unit == "F":
-        return celsius * (9 / 5) + 32, "°F"
-    return celsius, "°C"
-
-
-def get_local_timezone():
-    """Get the local timezone name"""
-    try:
-        # Try to get system timezone
-        return str(datetime.now().astimezone().tzinfo)
-    except:
-        return "UTC"  # Fallback to UTC if local timezone can't be determined
-
-
-def format_local_time(timestamp, timezone_str=None):
-    """Convert UTC timestamp to local time"""
-    try:
-        utc_time = datetime.fromtimestamp(timestamp, tz=pytz.UTC)
-        if timezone_str:
-            local_tz = pytz.timezone(timezone_str)
-            local_time = utc_time.astimezone(local_tz)
-        else:
-            local_time = utc_time.astimezone()
-        return local_time.strftime("%H:%M:%S %Z")
-    except:
-        # Fallback to UTC if conversion fails
-        return datetime.fromtimestamp(timestamp, tz=pytz.UTC).strftime("%H:%M:%S UTC")
-
-
 def get_uv_index(lat, lon):
-    """Fetch UV index data from OpenWeatherMap API"""
-    try:
-        params = {
-            "appid": Api_Key,
-            "lat": lat,
-            "lon": lon,
-            "exclude": "minutely,hourly,daily,alerts",
-        }
-        response = session.get(
-            "https://api.openweathermap.org/data/2.5/onecall", params=params, timeout=5
-        )
-        response.raise_for_status()
-        data = response.json()
-        return data.get("current", {}).get("uvi", None)
-    except:
-        return None
+    """UV index for a coordinate pair, None if unavailable
+
+    Goes through the shared service, so it is disk cached and concurrent
+    calls for one place share a request.
+    """
+    return weather_service.get_uv_index(lat, lon)
 
 
 def format_visibility(meters):
@@ -332,42 +348,33 @@ def get_wind_direction(degrees):
     return directions[index]
 
 
-def get_weather_emoji(description):
-    """Get weather emoji with logging for unknown conditions"""
-    emoji = WEATHER_EMOJIS.get(description.lower())
-    if emoji is None:
-        logger.warning(f"Unknown weather condition: {description}")
-        return "❓"
-    return emoji
+def get_weather_emoji(condition_id):
+    """Get weather emoji for an OWM condition id (memoized, warns once)"""
+    return condition_emoji(condition_id)
 
 
 def display_weather(weather_data, location, temp_unit):
     """Display enhanced weather information with additional metrics"""
-    description = weather_data["weather"][0]["description"]
-    weather_emoji = get_weather_emoji(description)
+    units = get_unit_system(temp_unit)
+    weather = units.convert_current(decode_current(weather_data))
+    description = weather.description
+    weather_emoji = get_weather_emoji(weather.condition_id)
 
     # Get coordinates for UV index
-    lat = weather_data["coord"]["lat"]
-    lon = weather_data["coord"]["lon"]
-    uv_index = get_uv_index(lat, lon)
+    uv_index = get_uv_index(weather.lat, weather.lon)
 
-    # Get local timezone from coordinates
-    timezone_str = weather_data.get("timezone", get_local_timezone())
-
-    # Temperature calculations
-    temp_kelvin = weather_data["main"]["temp"]
-    feels_like_kelvin = weather_data["main"]["feels_like"]
-    temp, unit = kelvin_to_preferred_unit(temp_kelvin, temp_unit)
-    feels_like, _ = kelvin_to_preferred_unit(feels_like_kelvin, temp_unit)
+    # Temperatures and wind are already in the requested units
+    unit = units.temp_symbol
+    speed_unit = units.speed_unit
 
     # Wind information
-    wind_speed = weather_data["wind"]["speed"]
-    wind_direction = get_wind_direction(weather_data["wind"].get("deg", 0))
-    wind_gust = weather_data["wind"].get("gust")
+    wind_direction = get_wind_direction(weather.wind_deg)
+    wind_gust = weather.wind_gust
 
-    # Format times
-    sunrise_time = format_local_time(weather_data["sys"]["sunrise"], timezone_str)
-    sunset_time = format_local_time(weather_data["sys"]["sunset"], timezone_str)
+    # Format times in the city's own UTC offset
+    sunrise_time, sunset_time = get_formatter(weather.timezone).format_many(
+        (weather.sunrise, weather.sunset), "%H:%M:%S %Z"
+    )
 
     header = f"\n{Fore.CYAN}{'='*60}{Style.RESET_ALL}"
 
@@ -376,23 +383,23 @@ def display_weather(weather_data, location, temp_unit):
         f"{Fore.YELLOW}📍 Weather in {Fore.WHITE}{location}{Style.RESET_ALL}\n"
         f"{weather_emoji} {Fore.CYAN}{description.capitalize()}{Style.RESET_ALL}\n\n"
         f"{Fore.GREEN}🌡️ Temperature:{Style.RESET_ALL}\n"
-        f"   Current: {Fore.WHITE}{temp:.1f}{unit}{Style.RESET_ALL}\n"
-        f"   Feels Like: {Fore.WHITE}{feels_like:.1f}{unit}{Style.RESET_ALL}\n"
-        f"   Min: {Fore.WHITE}{kelvin_to_preferred_unit(weather_data['main']['temp_min'], temp_unit)[0]:.1f}{unit}{Style.RESET_ALL}\n"
-        f"   Max: {Fore.WHITE}{kelvin_to_preferred_unit(weather_data['main']['temp_max'], temp_unit)[0]:.1f}{unit}{Style.RESET_ALL}\n\n"
+        f"   Current: {Fore.WHITE}{weather.temp:.1f}{unit}{Style.RESET_ALL}\n"
+        f"   Feels Like: {Fore.WHITE}{weather.feels_like:.1f}{unit}{Style.RESET_ALL}\n"
+        f"   Min: {Fore.WHITE}{weather.temp_min:.1f}{unit}{Style.RESET_ALL}\n"
+        f"   Max: {Fore.WHITE}{weather.temp_max:.1f}{unit}{Style.RESET_ALL}\n\n"
         f"{Fore.BLUE}💨 Wind:{Style.RESET_ALL}\n"
-        f"   Speed: {Fore.WHITE}{wind_speed} m/s{Style.RESET_ALL}\n"
-        f"   Direction: {Fore.WHITE}{wind_direction} ({weather_data['wind'].get('deg', 0)}°){Style.RESET_ALL}"
+        f"   Speed: {Fore.WHITE}{weather.wind_speed:.1f} {speed_unit}{Style.RESET_ALL}\n"
+        f"   Direction: {Fore.WHITE}{wind_direction} ({weather.wind_deg}°){Style.RESET_ALL}"
     )
 
     if wind_gust:
-        output += f"\n   Gusts up to: {Fore.WHITE}{wind_gust} m/s{Style.RESET_ALL}"
+        output += f"\n   Gusts up to: {Fore.WHITE}{wind_gust:.1f} {speed_unit}{Style.RESET_ALL}"
 
     output += (
         f"\n\n{Fore.BLUE}🌍 Atmospheric Conditions:{Style.RESET_ALL}\n"
-        f"   Humidity: {Fore.WHITE}{weather_data['main']['humidity']}%{Style.RESET_ALL}\n"
-        f"   Pressure: {Fore.WHITE}{weather_data['main']['pressure']} hPa{Style.RESET_ALL}\n"
-        f"   Visibility: {Fore.WHITE}{format_visibility(weather_data.get('visibility', 0))}{Style.RESET_ALL}"
+        f"   Humidity: {Fore.WHITE}{weather.humidity}%{Style.RESET_ALL}\n"
+        f"   Pressure: {Fore.WHITE}{weather.pressure} hPa{Style.RESET_ALL}\n"
+        f"   Visibility: {Fore.WHITE}{format_visibility(weather.visibility)}{Style.RESET_ALL}"
     )
 
     if uv_index is not None:
@@ -454,6 +461,7 @@ class UserPreferences:
             "default_city": "",
             "refresh_interval": "30",  # minutes
             "auto_detect_location": "true",
+            "fetch_mode": "separate",  # separate or onecall
         }
 
         self.preferences = defaults.copy()
@@ -545,6 +553,17 @@ class WeatherDashboardGUI:
         # Setup favorites dropdown
         self.setup_favorites_dropdown()
 
+        # Background event loop for network requests
+        self.async_bridge = TkAsyncBridge(self.root)
+
+        # Keys of the data currently on screen, used to skip redundant redraws
+        self.displayed_keys = {"current": None, "forecast": None}
+
+        # Cities whose stale cached data was refreshed in the background;
+        # filled from worker threads, drained on the Tk thread
+        self.refreshed_cities = queue.SimpleQueue()
+        self.refresh_poll_job = None
+
     def setup_header(self):
         """Setup header with search bar and theme toggle"""
         # Create header frame first
@@ -673,24 +692,94 @@ class WeatherDashboardGUI:
 
         logger.info(f"Refreshing weather data for city: {city}")
         self.refresh_btn.config(state="disabled")
-        threading.Thread(target=self.fetch_all_weather_data, args=(city,)).start()
+        self.async_bridge.submit(
+            self.fetch_all_weather_data(city),
+            self.on_weather_fetched,
+            on_error=self.on_weather_fetch_error,
+            on_done=self.on_refresh_done,
+        )
 
-    def fetch_all_weather_data(self, city):
-        """Fetch both current weather and forecast data"""
-        try:
-            weather_data = fetch_weather_data(city)
-            forecast_data = fetch_forecast_data(city)
+    def on_refresh_done(self):
+        self.refresh_btn.config(state="normal")
+        # Stale data may have been shown; pick up its background refresh
+        if weather_cache.refreshing() and self.refresh_poll_job is None:
+            self.refresh_poll_job = self.root.after(250, self.poll_cache_refreshes)
+
+    def poll_cache_refreshes(self):
+        """Redraw once a background cache refresh for the shown city lands
+
+        Runs only while refreshes are in flight. The in-flight check comes
+        before draining: a refresh queues its city before it stops counting
+        as in flight, so nothing is missed.
+        """
+        self.refresh_poll_job = None
+        in_flight = weather_cache.refreshing()
+        cities = set()
+        while not self.refreshed_cities.empty():
+            cities.add(self.refreshed_cities.get())
 
-            self.root.after(0, self.update_weather_display, weather_data)
-            self.root.after(0, self.update_forecast_display, forecast_data)
+        city = self.city_var.get().strip()
+        if city in cities:
+            # The cache is fresh now, so this is a local read
+            self.async_bridge.submit(
+                self.fetch_all_weather_data(city),
+                self.on_weather_fetched,
+                on_error=lambda e: logger.warning(
+                    f"Could not show refreshed data: {str(e)}"
+                ),
+            )
+        if in_flight:
+            self.refresh_poll_job = self.root.after(250, self.poll_cache_refreshes)
 
-        except Exception as e:
-            logger.error(f"Error fetching weather data: {str(e)}")
-            self.root.after(0, self.show_error, str(e))
-        finally:
-            self.root.after(0, lambda: self.refresh_btn.config(state="normal"))
+    async def fetch_all_weather_data(self, city):
+        """Fetch current weather and forecast data concurrently"""
+
+        def on_refresh(value):
+            self.refreshed_cities.put(city)
+
+        if self.preferences.preferences["fetch_mode"] == "onecall":
+            bundle = await asyncio.to_thread(get_cached_consolidated, city, on_refresh)
+            return bundle["current"], bundle["forecast"]
 
-    def update_weather_display(self, weather_data):
+        return await asyncio.gather(
+            asyncio.to_thread(get_cached_weather, city, on_refresh),
+            asyncio.to_thread(get_cached_forecast, city, on_refresh),
+        )
+
+    def on_weather_fetched(self, results):
+        """Update both displays once all weather data has arrived
+
+        Payloads whose place and timestamps match what is on screen (cache
+        hits and 304 revalidations) are not redrawn. Only those small keys
+        are kept, not the payloads.
+        """
+        weather_data, forecast_data = results
+        units = self.units
+        current_key = display_key(weather_data)
+        if current_key != self.displayed_keys["current"]:
+            weather = units.convert_current(decode_current(weather_data))
+            self.update_weather_display(weather)
+            self.displayed_keys["current"] = current_key
+        forecast_key = display_key(forecast_data)
+        if forecast_key != self.displayed_keys["forecast"]:
+            series = ForecastSeries.from_payload(forecast_data).converted(units)
+            self.update_forecast_display(series)
+            self.displayed_keys["forecast"] = forecast_key
+
+    @property
+    def units(self):
+        """UnitSystem selected by the `units` preference"""
+        return get_unit_system(self.preferences.preferences["units"])
+
+    def on_weather_fetch_error(self, error):
+        logger.error(f"Error fetching weather data: {str(error)}")
+        self.show_error(str(error))
+
+    def update_weather_display(self, weather):
+        """Update the current weather tab from a CurrentConditions
+
+        Values must already be converted to the preferred units.
+        """
         try:
             logger.info("Updating weather display")
             self.last_update_label.config(
@@ -698,47 +787,36 @@ class WeatherDashboardGUI:
             )
 
             # Update location
-            self.location_label.config(
-                text=f"📍 {weather_data['name']}, {weather_data['sys']['country']}"
-            )
+            self.location_label.config(text=f"📍 {weather.name}, {weather.country}")
 
             # Update weather icon and description
-            description = weather_data["weather"][0]["description"]
-            self.weather_icon.config(text=get_weather_emoji(description))
+            self.weather_icon.config(text=get_weather_emoji(weather.condition_id))
 
             # Update temperature
-            temp_unit = "C"  # or get it from a user preference setting
-            temp, unit = kelvin_to_preferred_unit(
-                weather_data["main"]["temp"], temp_unit
-            )
-            feels_like, _ = kelvin_to_preferred_unit(
-                weather_data["main"]["feels_like"], temp_unit
+            units = self.units
+            unit = units.temp_symbol
+            self.temp_label.config(text=f"{weather.temp:.1f}{unit}")
+            self.feels_like_label.config(
+                text=f"Feels like: {weather.feels_like:.1f}{unit}"
             )
 
-            self.temp_label.config(text=f"{temp:.1f}{unit}")
-            self.feels_like_label.config(text=f"Feels like: {feels_like:.1f}{unit}")
-
             # Update details
-            self.detail_labels["humidity"].config(
-                text=f"{weather_data['main']['humidity']}%"
-            )
+            self.detail_labels["humidity"].config(text=f"{weather.humidity}%")
 
-            wind_direction = get_wind_direction(weather_data["wind"].get("deg", 0))
+            wind_direction = get_wind_direction(weather.wind_deg)
             self.detail_labels["wind"].config(
-                text=f"{weather_data['wind']['speed']} m/s {wind_direction}"
+                text=f"{weather.wind_speed:.1f} {units.speed_unit} {wind_direction}"
             )
 
-            self.detail_labels["pressure"].config(
-                text=f"{weather_data['main']['pressure']} hPa"
-            )
+            self.detail_labels["pressure"].config(text=f"{weather.pressure} hPa")
 
-            visibility = format_visibility(weather_data.get("visibility", 0))
+            visibility = format_visibility(weather.visibility)
             self.detail_labels["visibility"].config(text=visibility)
 
-            # Convert sunrise/sunset times
-            timezone_str = weather_data.get("timezone", get_local_timezone())
-            sunrise = format_local_time(weather_data["sys"]["sunrise"], timezone_str)
-            sunset = format_local_time(weather_data["sys"]["sunset"], timezone_str)
+            # Sunrise/sunset in the city's own UTC offset
+            sunrise, sunset = get_formatter(weather.timezone).format_many(
+                (weather.sunrise, weather.sunset), "%H:%M:%S %Z"
+            )
 
             self.detail_labels["sunrise"].config(text=sunrise)
             self.detail_labels["sunset"].config(text=sunset)
@@ -767,17 +845,25 @@ class WeatherDashboardGUI:
             "temp_range": (0, 0),  # (min_temp, max_temp)
         }
 
-        # Create tooltip label for hover information
-        self.tooltip = ttk.Label(chart_container, text="", style="tooltip.TLabel")
-
         # Create canvas with minimum size and weight
         self.chart_canvas = tk.Canvas(
             chart_container, background="#1e2d3e", height=300, cursor="crosshair"
         )
         self.chart_canvas.pack(fill=tk.BOTH, expand=True, padx=20)
+        self.chart_scene = ChartScene(self.chart_canvas)
+
+        # Tooltip and highlight for hovered points, as reused canvas items
+        self.chart_hover = ChartHover(self.chart_canvas, self.describe_chart_point)
 
-        # Add resize handler
-        self.chart_canvas.bind("<Configure>", self.on_canvas_resize)
+        # Stretch the chart while the size changes, relayout once it settles
+        self.chart_resizer = ResizeCoalescer(
+            self.chart_canvas, self.on_canvas_resize, preview=self.preview_chart_resize
+        )
+
+        # Hold relayouts while the forecast tab or window is hidden
+        self.chart_visibility = VisibilityMonitor(
+            self.chart_canvas, self.on_chart_visibility
+        )
 
         # Create legend below chart
         legend_frame = ttk.Frame(forecast_frame)
@@ -798,76 +884,56 @@ class WeatherDashboardGUI:
         for i in range(7):
             self.daily_summary_frame.columnconfigure(i, weight=1)
 
-    def on_canvas_resize(self, event):
-        """Handle canvas resize event"""
+    def preview_chart_resize(self, scale_x, scale_y):
+        """Stretch the chart while a resize is in progress"""
+        self.chart_hover.hide()
+        self.chart_scene.scale(scale_x, scale_y)
+
+    def on_chart_visibility(self, visible):
+        """Pause chart work while it cannot be seen, catch up when shown"""
+        if visible:
+            self.chart_resizer.resume()
+        else:
+            self.chart_resizer.pause()
+            self.chart_hover.on_leave(None)
+
+    def describe_chart_point(self, i):
+        """Tooltip text for chart point i"""
+        x, y, temp, date, description = self.chart_data["points"][i]
+        return (
+            f"{date.strftime('%a %H:%M')}\n"
+            f"{temp:.1f}{self.units.temp_symbol}\n"
+            f"{description.capitalize()}"
+        )
+
+    def on_canvas_resize(self, width, height):
+        """Relayout the chart once the canvas size has settled"""
         if hasattr(self, "last_forecast_data"):
             # Redraw chart with new dimensions
-            self.draw_temperature_chart(
-                self.last_forecast_data["dates"],
-                self.last_forecast_data["temps"],
-                self.last_forecast_data["descriptions"],
-            )
+            self.draw_temperature_chart(self.last_forecast_data)
 
-    def update_forecast_display(self, forecast_data):
-        """Update the forecast display with new data"""
+    def update_forecast_display(self, series):
+        """Update the forecast display from a ForecastSeries"""
         try:
             logger.info("Updating forecast display")
 
-            dates = []
-            temps = []
-            descriptions = []
-
-            for item in forecast_data["list"]:
-                dt = datetime.fromtimestamp(item["dt"])
-                temp = item["main"]["temp"] - 273.15
-                desc = item["weather"][0]["description"]
-
-                dates.append(dt)
-                temps.append(temp)
-                descriptions.append(desc)
-
             # Store the data for resize events
-            self.last_forecast_data = {
-                "dates": dates,
-                "temps": temps,
-                "descriptions": descriptions,
-            }
+            self.last_forecast_data = series
 
             # Draw enhanced temperature chart
-            self.draw_temperature_chart(dates, temps, descriptions)
+            self.draw_temperature_chart(series)
 
             # Update daily forecast details
-            daily_forecasts = self.process_daily_forecasts(forecast_data["list"])
+            daily_forecasts = self.process_daily_forecasts(series)
             self.update_daily_forecast_display(daily_forecasts)
 
         except Exception as e:
             logger.error(f"Error updating forecast display: {str(e)}")
             self.show_error(f"Error updating forecast display: {str(e)}")
 
-    def process_daily_forecasts(self, forecast_list):
-        """Process forecast list into daily summaries"""
-        daily_forecasts = {}
-
-        for item in forecast_list:
-            dt = datetime.fromtimestamp(item["dt"])
-            date = dt.date()
-
-            if date not in daily_forecasts:
-                daily_forecasts[date] = {
-                    "temp_min": float("inf"),
-                    "temp_max": float("-inf"),
-                    "description": item["weather"][0]["description"],
-                }
-
-            temp = item["main"]["temp"] - 273.15
-            daily_forecasts[date]["temp_min"] = min(
-                daily_forecasts[date]["temp_min"], temp
-            )
-            daily_forecasts[date]["temp_max"] = max(
-                daily_forecasts[date]["temp_max"], temp
-            )
-
-        return dict(sorted(daily_forecasts.items())[:7])
+    def process_daily_forecasts(self, series):
+        """Reduce a ForecastSeries to up to seven DailySummary rows"""
+        return series.daily(limit=7)
 
     def update_daily_forecast_display(self, daily_forecasts):
         """Update the daily forecast summary"""
@@ -882,33 +948,45 @@ class WeatherDashboardGUI:
                 widget.destroy()
 
             # Create summary for each day
-            for i, (date, forecast) in enumerate(daily_forecasts.items()):
+            for i, day in enumerate(daily_forecasts):
                 day_frame = ttk.Frame(self.daily_summary_frame)
                 day_frame.grid(row=0, column=i, padx=5, pady=5, sticky="nsew")
                 self.daily_summary_frame.columnconfigure(i, weight=1)
 
                 ttk.Label(
-                    day_frame, text=date.strftime("%a"), font=("Helvetica", 9, "bold")
+                    day_frame,
+                    text=day.date.strftime("%a"),
+                    font=("Helvetica", 9, "bold"),
                 ).pack()
 
                 ttk.Label(
                     day_frame,
-                    text=get_weather_emoji(forecast["description"].lower()),
+                    text=get_weather_emoji(day.condition_id),
                     font=("Segoe UI Emoji", 20),
                 ).pack()
 
                 ttk.Label(
                     day_frame,
-                    text=f"{forecast['temp_max']:.1f}°/{forecast['temp_min']:.1f}°",
+                    text=f"{day.temp_max:.1f}°/{day.temp_min:.1f}°",
                     font=("Helvetica", 9),
                 ).pack()
 
         except Exception as e:
             logger.error(f"Error updating daily forecast display: {str(e)}")
 
-    def draw_temperature_chart(self, dates, temps, descriptions):
-        """Draw enhanced temperature chart using Tkinter canvas"""
-        self.chart_canvas.delete("all")  # Clear previous drawing
+    def draw_temperature_chart(self, series):
+        """Draw enhanced temperature chart using Tkinter canvas
+
+        Items are retained in self.chart_scene and updated in place.
+        """
+        dates = series.datetimes()
+        labels = series.labels("%H:%M")
+        temps = series.temperatures()
+        descriptions = series.descriptions
+        condition_ids = series.condition_id
+        to_celsius = (series.units or self.units).celsius
+        scene = self.chart_scene
+
         self.chart_data["points"] = []  # Clear previous points data
 
         # Get actual canvas size
@@ -931,37 +1009,41 @@ class WeatherDashboardGUI:
         max_temp = max(temps)
         temp_range = max(max_temp - min_temp, 1)
 
-        # Draw gradient background (without alpha)
-        gradient_steps = 20
-        for i in range(gradient_steps):
-            y1 = padding + (chart_height * i / gradient_steps)
-            y2 = padding + (chart_height * (i + 1) / gradient_steps)
-            temp = max_temp - (temp_range * i / gradient_steps)
-            color = self.get_temperature_color(temp)
-            # Remove alpha parameter
-            self.chart_canvas.create_rectangle(
-                padding, y1, padding + chart_width, y2, fill=color, outline=color
-            )
+        # Gradient background: one cached image for this size and range
+        background = gradient_cache.vertical(
+            self.chart_canvas,
+            TEMPERATURE_RAMP,
+            chart_width,
+            chart_height,
+            to_celsius(max_temp),
+            to_celsius(min_temp),
+        )
+        gradient = scene.item("gradient", "image", anchor="nw")
+        scene.update(gradient, (padding, padding), image=background)
 
-        # Draw axes and labels
+        # Axes and labels
         self.draw_axes(padding, width, height, chart_height, min_temp, max_temp)
 
-        # Draw time labels
-        time_interval = max(len(dates) // 6, 1)
-        for i in range(0, len(dates), time_interval):
-            x = padding + (chart_width * i / (len(dates) - 1))
-            self.chart_canvas.create_text(
-                x,
-                height - padding + 15,
-                text=dates[i].strftime("%H:%M"),
-                fill="white",
-                anchor="n",
-            )
+        # Time labels
+        # Points sit at their time; OneCall forecasts widen to daily spacing
+        count = len(dates)
+        xs = [padding + chart_width * f for f in series.time_fractions()]
+        time_interval = max(count // 6, 1)
+        label_indexes = range(0, count, time_interval)
+        time_labels = scene.items(
+            "time_label", len(label_indexes), "text", fill="white", anchor="n"
+        )
+        for label, i in zip(time_labels, label_indexes):
+            scene.update(label, (xs[i], height - padding + 15), text=labels[i])
 
-        # Draw temperature line and points
+        # Temperature points with weather emoji
+        icons = scene.items(
+            "icon", count, "text", font=("Segoe UI Emoji", 12), fill="white"
+        )
+        dots = scene.items("point", count, "oval", outline="white")
         points = []
-        for i in range(len(dates)):
-            x = padding + (chart_width * i / (len(dates) - 1))
+        for i in range(count):
+            x = xs[i]
             y = (
                 padding
                 + chart_height
@@ -974,64 +1056,43 @@ class WeatherDashboardGUI:
                 (x, y, temps[i], dates[i], descriptions[i])
             )
 
-            # Draw weather emoji
-            emoji = get_weather_emoji(descriptions[i])
-            self.chart_canvas.create_text(
-                x, y - 15, text=emoji, font=("Segoe UI Emoji", 12), fill="white"
+            scene.update(
+                icons[i], (x, y - 15), text=get_weather_emoji(condition_ids[i])
             )
+            color = temperature_color(to_celsius(temps[i]))
+            scene.update(dots[i], (x - 4, y - 4, x + 4, y + 4), fill=color)
 
-            # Draw temperature point with color based on temperature
-            color = self.get_temperature_color(temps[i])
-            self.chart_canvas.create_oval(
-                x - 4, y - 4, x + 4, y + 4, fill=color, outline="white"
-            )
+        # Smooth temperature line on top
+        trend = scene.item("trend", "line", fill="white", width=2, smooth=True)
+        if count >= 2:
+            scene.update(trend, points, state="normal")
+        else:
+            scene.update(trend, state="hidden")
+        self.chart_canvas.tag_raise("trend")
 
-        # Draw smooth temperature line
-        if len(points) >= 4:
-            self.chart_canvas.create_line(points, fill="white", width=2, smooth=True)
+        self.chart_hover.set_points(
+            (x, y, i) for i, (x, y, *_) in enumerate(self.chart_data["points"])
+        )
 
     def draw_axes(self, padding, width, height, chart_height, min_temp, max_temp):
-        """Draw chart axes with grid and labels"""
-        # Draw main axes
-        self.chart_canvas.create_line(
-            padding, padding, padding, height - padding, fill="white", width=1
-        )
-        self.chart_canvas.create_line(
-            padding,
-            height - padding,
-            width - padding,
-            height - padding,
-            fill="white",
-            width=1,
+        """Lay out chart axes with grid and labels"""
+        scene = self.chart_scene
+
+        # Main axes
+        y_axis, x_axis = scene.items("axis", 2, "line", fill="white", width=1)
+        scene.update(y_axis, (padding, padding, padding, height - padding))
+        scene.update(
+            x_axis, (padding, height - padding, width - padding, height - padding)
         )
 
-        # Draw temperature grid and labels
+        # Temperature grid and labels
+        grid_lines = scene.items("grid", 5, "line", fill="gray", dash=(2, 4))
+        grid_labels = scene.items("grid_label", 5, "text", fill="white", anchor="e")
         for i in range(5):
             y = padding + (chart_height * i / 4)
             temp = max_temp - ((max_temp - min_temp) * i / 4)
-
-            # Draw horizontal grid line
-            self.chart_canvas.create_line(
-                padding, y, width - padding, y, fill="gray", dash=(2, 4)
-            )
-
-            # Draw temperature label
-            self.chart_canvas.create_text(
-                padding - 20, y, text=f"{temp:.1f}°", fill="white", anchor="e"
-            )
-
-    def get_temperature_color(self, temp):
-        """Return color based on temperature"""
-        if temp <= 0:
-            return "#4575b4"  # Cold blue
-        elif temp <= 10:
-            return "#74add1"  # Cool blue
-        elif temp <= 20:
-            return "#fee090"  # Warm yellow
-        elif temp <= 30:
-            return "#f46d43"  # Warm orange
-        else:
-            return "#d73027"  # Hot red
+            scene.update(grid_lines[i], (padding, y, width - padding, y))
+            scene.update(grid_labels[i], (padding - 20, y), text=f"{temp:.1f}°")
 
     def setup_menu(self):
         """Setup application menu"""
@@ -1105,6 +1166,16 @@ class WeatherDashboardGUI:
             variable=auto_detect_var,
         ).pack(fill="x", padx=10, pady=5)
 
+        # Single OneCall request instead of separate weather/forecast calls
+        onecall_var = tk.BooleanVar(
+            value=self.preferences.preferences["fetch_mode"] == "onecall"
+        )
+        ttk.Checkbutton(
+            prefs_window,
+            text="Fetch all data in a single request (OneCall)",
+            variable=onecall_var,
+        ).pack(fill="x", padx=10, pady=5)
+
         # Refresh interval
         refresh_frame = ttk.LabelFrame(prefs_window, text="Refresh Interval")
         refresh_frame.pack(fill="x", padx=10, pady=5)
@@ -1117,11 +1188,17 @@ class WeatherDashboardGUI:
 
         # Save button
         def save_preferences():
+            if unit_var.get() != self.preferences.preferences["units"]:
+                # Cached payloads are unchanged, so force a redraw in new units
+                self.displayed_keys = dict.fromkeys(self.displayed_keys)
             self.preferences.save_preference("units", unit_var.get())
             self.preferences.save_preference(
                 "auto_detect_location", str(auto_detect_var.get()).lower()
             )
             self.preferences.save_preference("refresh_interval", refresh_var.get())
+            self.preferences.save_preference(
+                "fetch_mode", "onecall" if onecall_var.get() else "separate"
+            )
             prefs_window.destroy()
             self.refresh_weather()  # Refresh with new settings
 
@@ -1182,16 +1259,40 @@ class WeatherDashboardGUI:
 
 
 def fetch_forecast_data(location):
-    """Fetch 5-day forecast data from API"""
+    """Fetch forecast data, reading through the on-disk cache"""
+    key = normalize_location(location)
+    return inflight.do(
+        ("forecast", key),
+        lambda: disk_cache.read_through(
+            "forecast",
+            key,
+            lambda validators: request_forecast_data(location, validators),
+            is_transient=is_transient_fetch_error,
+        ),
+    )
+
+
+def request_forecast_data(location, validators=None):
+    """Fetch 5-day forecast data from API
+
+    Returns (data, validators), or NOT_MODIFIED when the server confirms the
+    cached copy described by `validators` is still current.
+    """
     try:
         logger.info(f"Fetching forecast data for location: {location}")
         params = {"appid": Api_Key, "q": location}
-        response = session.get(FORECAST_URL, params=params)
+        response = session.get(
+            FORECAST_URL,
+            params=params,
+            headers=conditional_headers(validators or {}),
+        )
+        if response.status_code == 304:
+            return NOT_MODIFIED
         response.raise_for_status()
 
         forecast_data = response.json()
         logger.info("Forecast data successfully retrieved")
-        return forecast_data
+        return forecast_data, response_validators(response)
     except Exception as e:
         logger.error(f"Error fetching forecast: {str(e)}")
         raise